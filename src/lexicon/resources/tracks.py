@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Optional, Sequence, Literal, Mapping, cast
+from itertools import chain
+from typing import Iterable, Optional, Sequence, Literal, Mapping, cast
 
 from .base import Resource
 from .tracks_types import (
@@ -22,12 +23,17 @@ from .tracks_types import (
     _cuepoint_type_name,
 )
 from ..tools.tempo import beats_to_seconds, seconds_to_beats
+from ..utils import chunked
 from ._common_types import ValidationMode, _normalize_id_sequence
 
 
 class Tracks(Resource):
     """Track resource operations."""
 
+    # Maximum number of locations/IDs sent in a single add/delete request.
+    _ADD_BATCH_SIZE = 500
+    _DELETE_BATCH_SIZE = 500
+
     def _parse_enums(self, track: dict) -> dict:
         """Convert enum codes to names if raw_enums is disabled."""
         if self._client.raw_enums:
@@ -90,6 +96,7 @@ class Tracks(Resource):
         self,
         track_ids: Sequence[int],
         *,
+        strategy: Literal["auto", "per_id", "bulk"] = "auto",
         validation: ValidationMode = "warn",
         timeout: Optional[int] = None,
     ) -> list[TrackResponse | None] | None:
@@ -99,6 +106,15 @@ class Tracks(Resource):
         ----------
         track_ids
             Sequence of track IDs to fetch.
+        strategy
+            Fetch strategy:
+            - ``"auto"`` (default) probes the library size and fetches every
+              track in one paged list when the request covers at least 5% of
+              the library, otherwise fetches tracks one-by-one.
+            - ``"per_id"`` skips the probe and fetches tracks one-by-one;
+              suited to interactive callers requesting a handful of tracks.
+            - ``"bulk"`` skips the probe and fetches every track in one paged
+              list; suited to automation working on large batches.
         validation
             Validation mode: ``"off"`` sends inputs as-is, ``"warn"`` drops invalid
             inputs with warnings, and ``"strict"`` raises on invalid inputs.
@@ -126,19 +142,27 @@ class Tracks(Resource):
                     )
                     return None
 
-        # Always fetch IDs to estimate library size for the 5% cutoff.
-        all_ids = self.list(fields=["id"], timeout=timeout)
-        if not all_ids:
-            return [
-                self.get(track_id, timeout=timeout) if track_id in ids else None
-                for track_id in ids
-            ]
-
-        # Large requests are considered to be > 5% of total library size
-        cutoff = len(all_ids) * 0.05
+        if strategy not in ("auto", "per_id", "bulk"):
+            if validation == "strict":
+                raise ValueError(f"Invalid strategy for get_many: {strategy}")
+            self._logger.warning("Ignoring invalid strategy for get_many: %s", strategy)
+            strategy = "auto"
+
+        if strategy == "auto":
+            # Fetch IDs to estimate library size for the 5% cutoff.
+            all_ids = self.list(fields=["id"], timeout=timeout)
+            if not all_ids:
+                return [
+                    self.get(track_id, timeout=timeout) if track_id in ids else None
+                    for track_id in ids
+                ]
+
+            # Large requests are considered to be > 5% of total library size
+            cutoff = len(all_ids) * 0.05
+            strategy = "bulk" if len(ids) >= cutoff else "per_id"
 
         # Get all tracks and trim by id for large requests
-        if len(ids) >= cutoff:
+        if strategy == "bulk":
             all_tracks = self.list(fields="all", timeout=timeout) or []
             by_id = {
                 track.get("id"): track
@@ -231,7 +255,7 @@ class Tracks(Resource):
                 )  # pragma: no branch
 
         # Sort - validate and add to payload
-        sort_fields = []
+        sort_fields: Iterable[TrackField] = ()
         if sort:
             if validation == "off":
                 payload["sort"] = sort
@@ -252,7 +276,8 @@ class Tracks(Resource):
                         )
                     if sort_payload:
                         sort_fields = cast(
-                            list[TrackField], [entry["field"] for entry in sort_payload]
+                            Iterable[TrackField],
+                            (entry["field"] for entry in sort_payload),
                         )
                         payload["sort"] = sort_payload
                 except ValueError as e:
@@ -336,7 +361,7 @@ class Tracks(Resource):
         # Filter (search parameters) - validate and add to payload
         if validation == "off":
             payload["filter"] = filter
-            filter_fields = []
+            filter_fields: Iterable[TrackField] = ()
         else:
             try:
                 filter_payload, invalid_fields, value_errors = _normalize_filters(
@@ -345,7 +370,7 @@ class Tracks(Resource):
             except ValueError as e:
                 if validation == "strict":
                     raise
-                self._logger.warning(f"Skipping search: {e}")
+                self._logger.warning("Skipping search: %s", e)
                 return None
             if invalid_fields:
                 if validation == "strict":
@@ -358,9 +383,7 @@ class Tracks(Resource):
                     raise ValueError(f"Invalid filter values: {value_errors}")
                 self._logger.warning("Skipping invalid filter values: %s", value_errors)
 
-            filter_fields = cast(
-                list[TrackField], [field for field in filter_payload.keys()]
-            )
+            filter_fields = cast(Iterable[TrackField], filter_payload.keys())
             payload["filter"] = filter_payload
 
         # Source - validate and add to payload
@@ -377,7 +400,7 @@ class Tracks(Resource):
                 )  # pragma: no branch
 
         # Sort - validate and add to payload
-        sort_fields = []
+        sort_fields: Iterable[TrackField] = ()
         if sort:
             if validation == "off":
                 payload["sort"] = sort
@@ -398,13 +421,14 @@ class Tracks(Resource):
                         )
                     if sort_payload:
                         sort_fields = cast(
-                            list[TrackField], [entry["field"] for entry in sort_payload]
+                            Iterable[TrackField],
+                            (entry["field"] for entry in sort_payload),
                         )
                         payload["sort"] = sort_payload
                 except ValueError as e:
                     if validation == "strict":
                         raise
-                    self._logger.warning(f"Skipping sort: {e}")
+                    self._logger.warning("Skipping sort: %s", e)
 
         # Collect return fields, ensuring sort fields are included.
         # If fields="all", omit the fields list so the API returns all fields.
@@ -413,19 +437,19 @@ class Tracks(Resource):
                 payload["fields"] = fields
         else:
             fields_payload, input_str_error, invalid_fields = _normalize_fields(
-                fields, extra_fields=sort_fields + filter_fields
+                fields, extra_fields=chain(sort_fields, filter_fields)
             )
             if input_str_error:
                 if validation == "strict":
                     raise ValueError(f"Field returns: {input_str_error}")
-                self._logger.warning(f"Using default field returns: {input_str_error}")
+                self._logger.warning("Using default field returns: %s", input_str_error)
             if invalid_fields:
                 if validation == "strict":
                     raise ValueError(
                         f"Invalid field names for return: {invalid_fields}"
                     )
                 self._logger.warning(
-                    f"Skipped returning invalid field names: {invalid_fields}"
+                    "Skipped returning invalid field names: %s", invalid_fields
                 )
 
             if fields_payload is not None:
@@ -487,6 +511,10 @@ class Tracks(Resource):
         will cause the track to be processed after addition. The returned track dict will be out
         of date until processing is complete. Probe the track again (check dateModified) to check for
         processing completion.
+
+        Locations are sent in batches of ``_ADD_BATCH_SIZE``. If a later batch
+        fails, the tracks added by earlier batches are returned and a warning
+        is logged; None is returned only when nothing was added.
         """
         if isinstance(locations, (str, bytes)) or not isinstance(locations, Sequence):
             if validation == "strict":
@@ -505,23 +533,44 @@ class Tracks(Resource):
                 self._logger.warning("Invalid locations payload for add: %s", locations)
                 return None
 
-        response = self._post(
-            "/tracks", json={"locations": location_list}, timeout=timeout
+        # Large inputs are split into several requests to keep each one small.
+        # An empty list only gets here with validation off and is sent as-is.
+        batches = (
+            chunked(location_list, self._ADD_BATCH_SIZE)
+            if location_list
+            else [location_list]
         )
-        if not isinstance(response, dict):
-            return None
-
-        data = response.get("data") if isinstance(response, dict) else None
-        tracks = data.get("tracks") if isinstance(data, dict) else None
-        if isinstance(tracks, list):
-            return cast(
-                list[TrackResponse],
-                [self._parse_enums(t) if isinstance(t, dict) else t for t in tracks],
+        added: list[TrackResponse] = []
+        for batch in batches:
+            response = self._post(
+                "/tracks", json={"locations": list(batch)}, timeout=timeout
             )
-        if isinstance(tracks, dict):
-            return [cast(TrackResponse, self._parse_enums(tracks))]
-        self._logger.warning("Add tracks response missing expected track list.")
-        return None
+            data = response.get("data") if isinstance(response, dict) else None
+            tracks = data.get("tracks") if isinstance(data, dict) else None
+            if isinstance(tracks, list):
+                added.extend(
+                    cast(TrackResponse, self._parse_enums(t))
+                    if isinstance(t, dict)
+                    else t
+                    for t in tracks
+                )
+            elif isinstance(tracks, dict):
+                added.append(cast(TrackResponse, self._parse_enums(tracks)))
+            else:
+                if isinstance(response, dict):
+                    self._logger.warning(
+                        "Add tracks response missing expected track list."
+                    )
+                if not added:
+                    return None
+                # Earlier batches were added; return them rather than losing them
+                self._logger.warning(
+                    "Add tracks batch failed; returning %s tracks added by "
+                    "earlier batches",
+                    len(added),
+                )
+                return added
+        return added
 
     def update(
         self,
@@ -580,7 +629,7 @@ class Tracks(Resource):
             except ValueError as e:
                 if validation == "strict":
                     raise
-                self._logger.warning(f"Invalid updates: {e}")
+                self._logger.warning("Invalid updates: %s", e)
                 return None
             if invalid_fields:
                 if validation == "strict":
@@ -769,24 +818,31 @@ class Tracks(Resource):
         -------
         bool
             True if the delete succeeded, otherwise False.
+
+        Notes
+        -----
+        Validated IDs are deleted in batches of ``_DELETE_BATCH_SIZE``; the
+        result is False if any batch fails.
         """
         if validation == "off":
             # Pass through directly to API without any shape validation
-            payload = {"ids": track_ids}
-        else:
-            # Normalize and validate
-            ids = _normalize_id_sequence(track_ids)
-            if ids is None:
-                if validation == "strict":
-                    raise ValueError(f"Invalid track_ids for delete: {track_ids}")
-                if validation == "warn":  # pragma: no branch - strict raises above
-                    self._logger.warning("Invalid track_ids for delete: %s", track_ids)
-                    return False
+            response = self._delete("/tracks", json={"ids": track_ids}, timeout=timeout)
+            return response is not None
 
-            payload = {"ids": ids}
+        # Normalize and validate
+        ids = _normalize_id_sequence(track_ids)
+        if ids is None:
+            if validation == "strict":
+                raise ValueError(f"Invalid track_ids for delete: {track_ids}")
+            self._logger.warning("Invalid track_ids for delete: %s", track_ids)
+            return False
 
-        response = self._delete("/tracks", json=payload, timeout=timeout)
-        return response is not None
+        # Large inputs are split into several requests to keep each one small.
+        success = True
+        for batch in chunked(ids, self._DELETE_BATCH_SIZE):
+            response = self._delete("/tracks", json={"ids": batch}, timeout=timeout)
+            success = success and response is not None
+        return success
 
     def _paged_tracks_json(
         self,
@@ -816,9 +872,9 @@ class Tracks(Resource):
             if not isinstance(response, dict):
                 return None
 
-            data = response.get("data") if isinstance(response, dict) else None
+            data = response.get("data")
             tracks = data.get("tracks") if isinstance(data, dict) else None
-            if not isinstance(tracks, list):
+            if not isinstance(data, dict) or not isinstance(tracks, list):
                 self._logger.warning(
                     "Tracks response missing expected list; Response was %s", response
                 )
@@ -833,8 +889,9 @@ class Tracks(Resource):
                 if remaining <= 0:
                     break
 
-            total = data.get("total") if isinstance(data, dict) else None
-            page_size = data.get("limit") if isinstance(data, dict) else None
+            # data is known to be a dict here, so no further type checks
+            total = data.get("total")
+            page_size = data.get("limit")
             if isinstance(total, int) and isinstance(page_size, int):
                 if next_offset + page_size >= total:
                     break
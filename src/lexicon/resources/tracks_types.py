@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 from typing import (
+    Any,
+    Callable,
+    Iterable,
     Literal,
     Mapping,
     TypedDict,
@@ -13,6 +16,8 @@ from typing import (
 )
 from datetime import date, datetime
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
 import re
 import sys
 
@@ -38,8 +43,20 @@ __all__ = [
     "SortField",
 ]
 
+# Patterns used by the string normalizers below
+_NUM_NONE_RE = re.compile(r"^\s*none\s*$", re.IGNORECASE)
+_NUM_RANGE_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)\s*$")
+_NUM_CMP_RE = re.compile(r"^\s*(?:[<>!]|<=|>=)?\s*\d+(?:\.\d+)?\s*$")
+_NUM_EDIT_RE = re.compile(r"^\s*[+-]?\d+(?:\.\d+)?\s*$")
+_DATE_FILTER_RE = re.compile(r"^(?P<op>[<>]=?)?\s*(\d{4}-\d{2}-\d{2})")
+_TAG_FILTER_RE = re.compile(r"^\s*~?\s*!?[^,]+(?:\s*,\s*!?[^,]+)*\s*$")
+
 # region --- FIELD TYPES AND VALIDATION ---
 
+# The Literal aliases are the source of truth and their value tuples are read
+# once at import via get_args(). Building the aliases from the tuples instead
+# (Literal[*TUPLE]) needs Python 3.11+ and hides the values from type checkers.
+
 # Track source filters for list and search endpoints
 TrackSource = Literal["non-archived", "all", "archived", "incoming"]
 TRACK_SOURCES: tuple[TrackSource, ...] = get_args(TrackSource)
@@ -98,6 +115,8 @@ TrackField = Literal[
     "streamingId",
 ]
 TRACK_FIELDS: tuple[TrackField, ...] = get_args(TrackField)
+# Private frozenset mirrors of the field tuples are used for membership checks.
+_TRACK_FIELDS_SET: frozenset[str] = frozenset(TRACK_FIELDS)
 
 # Default return fields for track list and search endpoints
 DEFAULT_TRACK_FIELDS: tuple[TrackField, ...] = (
@@ -115,7 +134,7 @@ DEFAULT_TRACK_FIELDS: tuple[TrackField, ...] = (
 def _normalize_fields(
     fields: Optional[Sequence[TrackField] | Literal["all", "*"]],
     *,
-    extra_fields: Optional[Sequence[TrackField]] = None,
+    extra_fields: Optional[Iterable[TrackField]] = None,
 ) -> tuple[list[TrackField] | None, Optional[str], Optional[list[str]]]:
     """Normalize field selection and return errors."""
     input_str_error: str | None = None
@@ -126,24 +145,28 @@ def _normalize_fields(
             f"String input must be 'all' or '*'; for a subset, pass a list "
             f"(e.g. ['id', 'location']). Got: {fields!r}"
         )
-        field_list = list(DEFAULT_TRACK_FIELDS)
+        requested: Iterable[TrackField] = DEFAULT_TRACK_FIELDS
     elif fields is None:
-        field_list = list(DEFAULT_TRACK_FIELDS)
+        requested = DEFAULT_TRACK_FIELDS
     else:
-        field_list = list(fields)
-
-    if extra_fields:
-        for field in extra_fields:
-            if field not in field_list:
-                field_list.append(field)
+        requested = fields
 
+    # Single pass over requested + extra fields, keeping the first occurrence.
+    seen: set[str] = set()
     valid_fields: list[TrackField] = []
     invalid_fields: list[str] | None = []
-    for field in field_list:
-        if field in TRACK_FIELDS:
-            valid_fields.append(field)
+    for fname in chain(requested, extra_fields or ()):
+        # Non-string entries (possibly unhashable) are reported as invalid
+        if not isinstance(fname, str):
+            invalid_fields.append(fname)
+            continue
+        if fname in seen:
+            continue
+        seen.add(fname)
+        if fname in _TRACK_FIELDS_SET:
+            valid_fields.append(fname)
         else:
-            invalid_fields.append(field)
+            invalid_fields.append(fname)
 
     invalid_fields = invalid_fields if invalid_fields else None
 
@@ -188,6 +211,7 @@ FilterField = Literal[
     "tags",
 ]
 FILTER_FIELDS: tuple[FilterField, ...] = get_args(FilterField)
+_FILTER_FIELDS_SET: frozenset[str] = frozenset(FILTER_FIELDS)
 
 
 def _normalize_filters(
@@ -200,24 +224,18 @@ def _normalize_filters(
     filter_payload: dict[FilterField, object] = {}
     invalid_fields: list[str] | None = []
     value_errors: list[str] | None = []
+    # Bound appends avoid a method lookup per field in the loop
+    add_invalid = invalid_fields.append
+    add_error = value_errors.append
     for fname, value in filters.items():
-        if fname not in FILTER_FIELDS:
-            invalid_fields.append(str(fname))
+        normalizer = _FILTER_NORMALIZERS.get(fname)
+        if normalizer is None:
+            add_invalid(str(fname))
             continue
         try:
-            if fname in BOOL_FIELDS:
-                value = _normalize_bool(value, context="filter")  # pragma: no cover
-            if fname in TEXT_FIELDS:
-                value = _normalize_text(value, context="filter")
-            if fname in NUMBER_FIELDS:
-                value = _normalize_number(value, context="filter")
-            if fname in DATE_FIELDS:
-                value = _normalize_date(value, context="filter")
-            if fname == "tags":
-                value = _normalize_tag_filter(value)
-            filter_payload[fname] = value
+            filter_payload[fname] = normalizer(value)
         except ValueError as exc:
-            value_errors.append(f"{fname}: {exc}")
+            add_error(f"{fname}: {exc}")
 
     invalid_fields = invalid_fields if invalid_fields else None
     value_errors = value_errors if value_errors else None
@@ -257,6 +275,7 @@ TrackEditField = Literal[
     "archived",
 ]
 TRACK_EDIT_FIELDS: tuple[TrackEditField, ...] = get_args(TrackEditField)
+_TRACK_EDIT_FIELDS_SET: frozenset[str] = frozenset(TRACK_EDIT_FIELDS)
 
 
 def _normalize_edits(
@@ -269,48 +288,34 @@ def _normalize_edits(
     edits_payload: dict[TrackEditField, object] = {}
     invalid_fields: list[str] | None = []
     value_errors: list[str] | None = []
+    # Bound appends avoid a method lookup per field in the loop
+    add_invalid = invalid_fields.append
+    add_error = value_errors.append
     for fname, value in edits.items():
-        if fname not in TRACK_EDIT_FIELDS:
-            invalid_fields.append(str(fname))
+        if fname not in _TRACK_EDIT_FIELDS_SET:
+            add_invalid(str(fname))
             continue
         try:
-            if fname in BOOL_FIELDS:
-                value = _normalize_bool(value, context="edit")
-            if fname in TEXT_FIELDS:
-                value = _normalize_text(value, context="edit")
-            if fname in NUMBER_FIELDS:
-                value = _normalize_number(value, context="edit")
-            if fname in DATE_FIELDS:
-                value = _normalize_date(value, context="edit")  # pragma: no cover
-            if fname == "tags":
-                value = _normalize_tags(value)
-            if fname == "cuepoints":
+            normalizer = _EDIT_NORMALIZERS.get(fname)
+            if normalizer is not None:
+                value = normalizer(value)
+            elif fname == "cuepoints":
                 value, cue_errors = _normalize_cuepoints(value)
-                if cue_errors.fatal:
-                    value_errors.extend(
-                        [f"cuepoints: {err}" for err in cue_errors.fatal]
-                    )
-                if cue_errors.dropped:
-                    value_errors.extend(
-                        [f"cuepoints: {err}" for err in cue_errors.dropped]
+                value_errors.extend(
+                    f"cuepoints: {err}"
+                    for err in chain(
+                        cue_errors.fatal, cue_errors.dropped, cue_errors.partial
                     )
-                if cue_errors.partial:
-                    value_errors.extend(
-                        [f"cuepoints: {err}" for err in cue_errors.partial]
-                    )
-            if fname == "tempomarkers":
+                )
+            elif fname == "tempomarkers":  # pragma: no branch - edit fields
                 value, tempo_errors = _normalize_tempomarkers(value)
-                if tempo_errors.fatal:
-                    value_errors.extend(
-                        [f"tempomarkers: {err}" for err in tempo_errors.fatal]
-                    )
-                if tempo_errors.dropped:
-                    value_errors.extend(
-                        [f"tempomarkers: {err}" for err in tempo_errors.dropped]
-                    )
+                value_errors.extend(
+                    f"tempomarkers: {err}"
+                    for err in chain(tempo_errors.fatal, tempo_errors.dropped)
+                )
             edits_payload[fname] = value
         except ValueError as exc:
-            value_errors.append(f"{fname}: {exc}")
+            add_error(f"{fname}: {exc}")
 
     invalid_fields = invalid_fields if invalid_fields else None
     value_errors = value_errors if value_errors else None
@@ -366,8 +371,11 @@ SortField = Literal[
     "streamingId",
 ]
 SORT_FIELDS: tuple[SortField, ...] = get_args(SortField)
+_SORT_FIELDS_SET: frozenset[str] = frozenset(SORT_FIELDS)
+_SORT_DISALLOWED_SET: frozenset[str] = frozenset(SortFieldDisallowed)
 SortDirection = Literal["asc", "desc"]
 SORT_DIRECTIONS: tuple[SortDirection, ...] = get_args(SortDirection)
+_SORT_DIRECTIONS_SET: frozenset[str] = frozenset(SORT_DIRECTIONS)
 SortDirectionInput = SortDirection | None
 SortInput = Sequence[tuple[SortField, SortDirectionInput]] | Sequence[dict[str, str]]
 
@@ -381,32 +389,47 @@ def _normalize_sorts(
     if isinstance(sort, (str, bytes)):
         raise ValueError("Sort must be a list/tuple, not a string")
 
-    sort_payload: list[dict[str, str]] = []
+    sort_pairs: list[tuple[str, str]] = []
     invalid_fields: list[str] | None = []
     value_errors: list[str] | None = []
+    # Bound appends avoid a method lookup per item in the loop
+    add_pair = sort_pairs.append
+    add_invalid = invalid_fields.append
+    add_error = value_errors.append
     for item in sort:
         if isinstance(item, dict):
             keys = item.keys()
             if "field" not in keys:
-                value_errors.append(f"Invalid keys: {keys}")
+                add_error(f"Invalid keys: {keys}")
                 continue
             item = (item["field"], item.get("dir"))
 
         if isinstance(item, tuple):
             field, direction = item
-            if field not in SORT_FIELDS:
-                invalid_fields.append(str(field))
+            # Non-string fields (possibly unhashable) are reported as invalid
+            if not isinstance(field, str):
+                add_invalid(str(field))
+                continue
+            if field in _SORT_DISALLOWED_SET:
+                add_error(f"Field not sortable: {field}")
+                continue
+            if field not in _SORT_FIELDS_SET:
+                add_invalid(str(field))
                 continue
             if direction:
-                if direction not in SORT_DIRECTIONS:
-                    value_errors.append(
-                        f"Invalid sort direction for {field}: {direction}"
-                    )
+                if (
+                    not isinstance(direction, str)
+                    or direction not in _SORT_DIRECTIONS_SET
+                ):
+                    add_error(f"Invalid sort direction for {field}: {direction}")
                     direction = None
-            entry: dict[str, str] = {"field": field}
-            entry["dir"] = direction or "asc"
-            sort_payload.append(entry)
+            add_pair((field, direction or "asc"))
 
+    # Drop repeated (field, dir) entries, keeping the first occurrence.
+    sort_payload: list[dict[str, str]] = [
+        {"field": field, "dir": direction}
+        for field, direction in dict.fromkeys(sort_pairs)
+    ]
     invalid_fields = invalid_fields if invalid_fields else None
     value_errors = value_errors if value_errors else None
     return sort_payload, invalid_fields, value_errors
@@ -415,24 +438,22 @@ def _normalize_sorts(
 # Field Types
 BoolField = Literal["archived", "incoming"]
 BOOL_FIELDS: tuple[BoolField, ...] = get_args(BoolField)
+_BOOL_FIELDS_SET: frozenset[str] = frozenset(BOOL_FIELDS)
+_BOOL_TRUE: frozenset[str] = frozenset(("1", "true", "yes"))
+_BOOL_FALSE: frozenset[str] = frozenset(("0", "false", "no"))
 
 
-def _normalize_bool(
-    value: object,
-    *,
-    context: Literal["filter", "edit"],
-) -> int:
+def _normalize_bool_value(value: object) -> int:
     """Normalize bool-like values to int."""
-    if isinstance(value, bool):
-        return int(value)
+    # bool is an int subclass, so True/False are handled here too
     if isinstance(value, (int, float)):
         if value in (0, 1):
             return int(value)
-    if isinstance(value, str):
+    elif isinstance(value, str):
         normalized = value.strip().lower()
-        if normalized in {"1", "true", "yes"}:
+        if normalized in _BOOL_TRUE:
             return 1
-        if normalized in {"0", "false", "no"}:
+        if normalized in _BOOL_FALSE:
             return 0
     raise ValueError(f"Input must be bool-like. Given [{value!r}]")
 
@@ -462,16 +483,20 @@ TextField = Literal[
     "beatshiftCase",
 ]
 TEXT_FIELDS: tuple[TextField, ...] = get_args(TextField)
+_TEXT_FIELDS_SET: frozenset[str] = frozenset(TEXT_FIELDS)
 
 
-def _normalize_text(
-    value: object,
-    *,
-    context: Literal["filter", "edit"],
-) -> str | None:
-    """Normalize text values."""
-    if value is None and context == "filter":
+def _normalize_text_filter(value: object) -> str:
+    """Normalize text filter values; None filters on empty text."""
+    if value is None:
         return "NONE"
+    if isinstance(value, str):
+        return value
+    raise ValueError(f"Input must be [str | None]. Given [{type(value)}]")
+
+
+def _normalize_text_edit(value: object) -> str | None:
+    """Normalize text edit values; None clears the field."""
     if value is None or isinstance(value, str):
         return value
     raise ValueError(f"Input must be [str | None]. Given [{type(value)}]")
@@ -496,44 +521,60 @@ NumberField = Literal[
     "type",
 ]
 NUMBER_FIELDS: tuple[NumberField, ...] = get_args(NumberField)
+_NUMBER_FIELDS_SET: frozenset[str] = frozenset(NUMBER_FIELDS)
 
 
-def _normalize_number(
-    value: object,
-    *,
-    context: Literal["filter", "edit"],
-) -> str | int | float | None:
-    """Normalize numeric values."""
+def _normalize_number_filter(value: object) -> str | int | float:
+    """Normalize numeric filter values, accepting range/comparison strings."""
+    if value is None:
+        return "0"
+    if isinstance(value, str):
+        return _number_filter_str(value)
+    return _positive_number(value)
+
+
+# String inputs repeat across calls and map to immutable strings, so their
+# regex parses are memoized. Only str keys reach these caches: 1, 1.0 and True
+# hash alike and would share an entry. Invalid strings raise and are not cached.
+@lru_cache(maxsize=1024)
+def _number_filter_str(value: str) -> str:
+    """Parse a numeric filter string (none, range or comparison)."""
+    if _NUM_NONE_RE.match(value):
+        return "0"
+    range_match = _NUM_RANGE_RE.match(value)
+    if range_match:
+        return f"{range_match.group(1)}-{range_match.group(2)}"
+    if _NUM_CMP_RE.match(value):
+        return value
+    raise ValueError(
+        "String input does not match range, inequality, or exclusion patterns. "
+        f"Given [{value!r}]"
+    )
+
+
+def _normalize_number_edit(value: object) -> str | int | float | None:
+    """Normalize numeric edit values, accepting +/- delta strings."""
     if value is None:
-        return "0" if context == "filter" else None
+        return None
+    if isinstance(value, str):
+        return _number_edit_str(value)
+    return _positive_number(value)
+
+
+@lru_cache(maxsize=1024)
+def _number_edit_str(value: str) -> str:
+    """Parse a numeric +/- delta edit string."""
+    if _NUM_EDIT_RE.match(value):
+        return value.strip()
+    raise ValueError(f"Input must be numeric or +/- delta string. Given [{value!r}]")
+
+
+def _positive_number(value: object) -> int | float:
+    """Validate a non-string numeric value shared by filters and edits."""
     if isinstance(value, (int, float)):
         if value > 0:
             return value
         raise ValueError(f"Numbers must be positive. Given: {value!r}")
-    if isinstance(value, str):
-        if context == "filter":
-            none_match = re.match(r"^\s*none\s*$", value, flags=re.IGNORECASE)
-            range_match = re.match(
-                r"^\s*(\d+(?:\.\d+)?)\s*-\s*(\d+(?:\.\d+)?)\s*$", value
-            )
-            compare_match = re.match(r"^\s*(?:[<>!]|<=|>=)?\s*\d+(?:\.\d+)?\s*$", value)
-            if not any([none_match, range_match, compare_match]):
-                raise ValueError(
-                    "String input does not match range, inequality, or exclusion patterns. "
-                    f"Given [{value!r}]"
-                )
-            if none_match:
-                value = "0"
-            if range_match:
-                value = f"{range_match.group(1)}-{range_match.group(2)}"
-            return value
-        elif context == "edit":
-            if re.match(r"^\s*[+-]?\d+(?:\.\d+)?\s*$", value):
-                return value.strip()
-            raise ValueError(
-                f"Input must be numeric or +/- delta string. Given [{value!r}]"
-            )
-        raise ValueError(f"Invalid context [{context}]")
     raise ValueError(
         f"Input must be numerical [str | int | float]. Given [{type(value)}]"
     )
@@ -541,45 +582,70 @@ def _normalize_number(
 
 DateField = Literal["lastPlayed", "dateAdded", "dateModified", "archivedSince"]
 DATE_FIELDS: tuple[DateField, ...] = get_args(DateField)
+_DATE_FIELDS_SET: frozenset[str] = frozenset(DATE_FIELDS)
 
 
-def _normalize_date(
-    value: object,
-    *,
-    context: Literal["filter", "edit"],
-) -> str | None:
-    """Normalize date values."""
+def _normalize_date_filter(value: object) -> str:
+    """Normalize date filter values; None filters on missing dates."""
     if isinstance(value, datetime):
         value = value.date()
     if isinstance(value, date):
         return value.isoformat()
     if value is None:
-        return "NONE" if context == "filter" else None
+        return "NONE"
     if isinstance(value, str):
-        if value.lower().strip() == "none":
-            return "NONE" if context == "filter" else None
-        if context == "filter":
-            date_match = re.match(r"^(?P<op>[<>]=?)?\s*(\d{4}-\d{2}-\d{2})", value)
-            if not date_match:
-                raise ValueError(
-                    f"Input must be in YYYY-MM-DD format. Given [{value!r}]"
-                )
-            if date_match.group("op"):
-                raise ValueError(
-                    "Comparison operators on date filters are not supported by the API"
-                )
-            date_iso = cast(str, date_match.group(2))
-            return date_iso
-        elif context == "edit":
-            date_match = re.match(r"^(\d{4}-\d{2}-\d{2})", value)
-            if not date_match:
-                raise ValueError(f"Input must be YYYY-MM-DD. Given [{value!r}]")
-            date_iso = cast(str, date_match.group(1))
-            return date_iso
-        raise ValueError(f"Invalid context [{context}]")
+        return _date_filter_str(value)
+    raise ValueError(f"Input must be a date. Given [{type(value)}]")
+
+
+# Date strings are memoized like the numeric strings above; date and
+# datetime inputs are converted directly and never reach these caches.
+@lru_cache(maxsize=256)
+def _date_filter_str(value: str) -> str:
+    """Parse a date filter string to its YYYY-MM-DD prefix."""
+    if value.lower().strip() == "none":
+        return "NONE"
+    date_match = _DATE_FILTER_RE.match(value)
+    if not date_match:
+        raise ValueError(f"Input must be in YYYY-MM-DD format. Given [{value!r}]")
+    if date_match.group("op"):
+        raise ValueError(
+            "Comparison operators on date filters are not supported by the API"
+        )
+    return cast(str, date_match.group(2))
+
+
+def _normalize_date_edit(value: object) -> str | None:
+    """Normalize date edit values; None clears the field."""
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value.isoformat()
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return _date_edit_str(value)
     raise ValueError(f"Input must be a date. Given [{type(value)}]")
 
 
+@lru_cache(maxsize=256)
+def _date_edit_str(value: str) -> str | None:
+    """Parse a date edit string to its YYYY-MM-DD prefix; "none" clears."""
+    if value.lower().strip() == "none":
+        return None
+    # Fixed-width YYYY-MM-DD prefix; str.isdecimal matches regex \d
+    if (
+        len(value) >= 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdecimal()
+        and value[5:7].isdecimal()
+        and value[8:10].isdecimal()
+    ):
+        return value[:10]
+    raise ValueError(f"Input must be YYYY-MM-DD. Given [{value!r}]")
+
+
 TagField = Literal["tags"]
 TAG_FIELDS: tuple[TagField, ...] = get_args(TagField)
 
@@ -592,8 +658,13 @@ def _normalize_tag_filter(
         raise ValueError("API does not support filtering on absence of tags")
     if not isinstance(value, str):
         raise ValueError(f"Input must be [str]. Given [{type(value)}]")
-    tag_match = re.match(r"^\s*~?\s*!?[^,]+(?:\s*,\s*!?[^,]+)*\s*$", value)
-    if not tag_match:
+    return _tag_filter_str(value)
+
+
+@lru_cache(maxsize=1024)
+def _tag_filter_str(value: str) -> str:
+    """Validate a tag filter string against the tag filter grammar."""
+    if not _TAG_FILTER_RE.match(value):
         raise ValueError(f"Tag filter string is invalid. Given [{value!r}]")
     return value
 
@@ -605,15 +676,64 @@ def _normalize_tags(
     if isinstance(value, list):
         if len(value) == 0:
             return []
-        tag_ids = {
-            tag_id for tag_id in value if isinstance(tag_id, int) and tag_id >= 1
-        }
+        # Single pass that filters and dedupes, keeping first-seen order
+        seen: set[int] = set()
+        tag_ids: list[int] = []
+        add_seen = seen.add
+        add_tag = tag_ids.append
+        for tag_id in value:
+            if not isinstance(tag_id, int) or tag_id < 1 or tag_id in seen:
+                continue
+            add_seen(tag_id)
+            add_tag(tag_id)
         if tag_ids:
-            return list(tag_ids)
+            return tag_ids
         raise ValueError("Tag list must contain positive ints")
     raise ValueError(f"Input must be list[int]. Given [{type(value)}]")
 
 
+def _build_normalizers(
+    allowed: frozenset[str],
+    type_normalizers: Sequence[tuple[Sequence[str], Callable[[object], object]]],
+) -> dict[str, Callable[[object], object]]:
+    """Map each allowed field to the normalizer for its field type."""
+    normalizers: dict[str, Callable[[object], object]] = {}
+    for type_fields, normalizer in type_normalizers:
+        for fname in type_fields:
+            if fname in allowed:
+                normalizers[fname] = normalizer
+    return normalizers
+
+
+# Per-field normalizers, so each input field costs a single dict lookup and
+# calls a context-specific variant directly.
+# Cuepoints and tempomarkers collect structured errors and are handled inline.
+_FILTER_NORMALIZERS: dict[str, Callable[[object], object]] = {
+    **_build_normalizers(
+        _FILTER_FIELDS_SET,
+        (
+            (BOOL_FIELDS, _normalize_bool_value),
+            (TEXT_FIELDS, _normalize_text_filter),
+            (NUMBER_FIELDS, _normalize_number_filter),
+            (DATE_FIELDS, _normalize_date_filter),
+        ),
+    ),
+    "tags": _normalize_tag_filter,
+}
+_EDIT_NORMALIZERS: dict[str, Callable[[object], object]] = {
+    **_build_normalizers(
+        _TRACK_EDIT_FIELDS_SET,
+        (
+            (BOOL_FIELDS, _normalize_bool_value),
+            (TEXT_FIELDS, _normalize_text_edit),
+            (NUMBER_FIELDS, _normalize_number_edit),
+            (DATE_FIELDS, _normalize_date_edit),
+        ),
+    ),
+    "tags": _normalize_tags,
+}
+
+
 # Cuepoint type literals (used by CuePointResponse and helpers below)
 CuePointTypeInt = Literal[1, 2, 3, 4, 5]
 CuePointTypeCode = Literal["1", "2", "3", "4", "5"]
@@ -621,6 +741,16 @@ CuePointTypeName = Literal["normal", "fade-in", "fade-out", "load", "loop"]
 CuePointType = CuePointTypeCode | CuePointTypeInt | CuePointTypeName
 CUEPOINT_TYPE_CODES: tuple[CuePointTypeCode, ...] = get_args(CuePointTypeCode)
 CUEPOINT_TYPE_NAMES: tuple[CuePointTypeName, ...] = get_args(CuePointTypeName)
+_CUEPOINT_TYPE_CODES_SET: frozenset[str] = frozenset(CUEPOINT_TYPE_CODES)
+_CUEPOINT_INT_TO_CODE: dict[int, CuePointTypeCode] = {
+    int(code): code for code in CUEPOINT_TYPE_CODES
+}
+_CUEPOINT_NAME_TO_CODE: dict[str, CuePointTypeCode] = dict(
+    zip(CUEPOINT_TYPE_NAMES, CUEPOINT_TYPE_CODES)
+)
+_CUEPOINT_CODE_TO_NAME: dict[str, CuePointTypeName] = dict(
+    zip(CUEPOINT_TYPE_CODES, CUEPOINT_TYPE_NAMES)
+)
 
 
 # Response shape for track resource responses
@@ -716,24 +846,26 @@ class CuePointUpdate(TypedDict, total=False):
 def _normalize_cuepoint_type(cuepoint_type: CuePointType) -> CuePointTypeCode:
     """Normalize cuepoint type to numeric code."""
     if isinstance(cuepoint_type, int):
-        if cuepoint_type in (1, 2, 3, 4, 5):
-            return CUEPOINT_TYPE_CODES[cuepoint_type - 1]
+        code = _CUEPOINT_INT_TO_CODE.get(cuepoint_type)
+        if code is not None:
+            return code
+        raise ValueError(f"Invalid cuepoint type: {cuepoint_type}")
+    if not isinstance(cuepoint_type, str):
         raise ValueError(f"Invalid cuepoint type: {cuepoint_type}")
-    if cuepoint_type in CUEPOINT_TYPE_CODES:
-        return cuepoint_type
-    if cuepoint_type in CUEPOINT_TYPE_NAMES:
-        return CUEPOINT_TYPE_CODES[CUEPOINT_TYPE_NAMES.index(cuepoint_type)]
+    if cuepoint_type in _CUEPOINT_TYPE_CODES_SET:
+        return cast(CuePointTypeCode, cuepoint_type)
+    code = _CUEPOINT_NAME_TO_CODE.get(cuepoint_type)
+    if code is not None:
+        return code
     raise ValueError(f"Invalid cuepoint type: {cuepoint_type}")
 
 
 def _cuepoint_type_name(code: str) -> CuePointTypeName | str:
     """Convert cuepoint type code to human-readable name."""
-    if code in CUEPOINT_TYPE_CODES:
-        return CUEPOINT_TYPE_NAMES[CUEPOINT_TYPE_CODES.index(code)]
-    return code
+    return _CUEPOINT_CODE_TO_NAME.get(code, code)
 
 
-@dataclass
+@dataclass(slots=True)
 class CuepointErrors:
     """Structured cuepoint validation errors."""
 
@@ -742,6 +874,26 @@ class CuepointErrors:
     partial: list[str] = field(default_factory=list)
 
 
+# Per-key cuepoint validation: (key, required, expected type, normalizer, message).
+# Keys with an expected type must match it exactly (ints are accepted and
+# converted for float keys) and are reported with ``message``; the others go
+# through ``normalizer``, which raises ValueError.
+_CUE_FIELD_SPEC: tuple[
+    tuple[str, bool, type | None, Callable[[Any], object] | None, str], ...
+] = (
+    ("position", True, int, None, "Positions must be int: {kind}"),
+    ("startTime", True, float, None, "startTime must be float: {kind}"),
+    ("type", True, None, _normalize_cuepoint_type, ""),
+    ("name", False, str, None, "Name must be a string: {value}"),
+    ("activeLoop", False, None, _normalize_bool_value, ""),
+    ("endTime", False, float, None, "endTime must be a float: {value}"),
+    ("color", False, None, _normalize_color, ""),
+)
+_CUE_REQUIRED: frozenset[str] = frozenset(
+    key for key, required, *_ in _CUE_FIELD_SPEC if required
+)
+
+
 def _normalize_cuepoints(
     cuepoints: object,
 ) -> tuple[list[CuePointUpdate], CuepointErrors]:
@@ -752,64 +904,49 @@ def _normalize_cuepoints(
         errors.fatal.append(f"Cuepoints must be a list. Given: [{type(cuepoints)}]")
         return normalized_cuepoints, errors
 
+    # Bound appends avoid attribute and method lookups per cuepoint key
+    add_cuepoint = normalized_cuepoints.append
+    add_dropped = errors.dropped.append
+    add_partial = errors.partial.append
     for cuepoint in cuepoints:
         if not isinstance(cuepoint, dict):
-            errors.dropped.append(f"Invalid cuepoint entry: {cuepoint}")
+            add_dropped(f"Invalid cuepoint entry: {cuepoint}")
             continue
-        cuepoint_payload = cast(CuePointUpdate, {})
-        missing_required = set(("position", "startTime", "type")) - cuepoint.keys()
+        missing_required = _CUE_REQUIRED - cuepoint.keys()
         if missing_required:
-            errors.dropped.append(f"Missing required keys: {missing_required}")
-            continue
-
-        position = cuepoint["position"]
-        if not isinstance(position, int):
-            errors.dropped.append(f"Positions must be int: {type(position)}")
-            continue
-        cuepoint_payload["position"] = position
-
-        startTime = cuepoint["startTime"]
-        if not isinstance(startTime, float):
-            errors.dropped.append(f"startTime must be float: {type(startTime)}")
+            add_dropped(f"Missing required keys: {set(missing_required)}")
             continue
-        cuepoint_payload["startTime"] = startTime
 
-        ctype = cuepoint["type"]
-        try:
-            cuepoint_payload["type"] = _normalize_cuepoint_type(ctype)
-        except ValueError as exc:
-            errors.dropped.append(str(exc))
-            continue
-
-        name = cuepoint.get("name")
-        if name is not None and not isinstance(name, str):
-            errors.partial.append(f"Name must be a string: {name}")
-        elif name is not None:  # pragma: no branch - covered by valid cuepoints
-            cuepoint_payload["name"] = name
-
-        activeLoop = cuepoint.get("activeLoop")
-        if activeLoop is not None:
-            try:
-                cuepoint_payload["activeLoop"] = _normalize_bool(
-                    activeLoop, context="edit"
-                )
-            except ValueError as exc:
-                errors.partial.append(str(exc))
-
-        endTime = cuepoint.get("endTime")
-        if endTime is not None and not isinstance(endTime, float):
-            errors.partial.append(f"endTime must be a float: {endTime}")
-        elif endTime is not None:
-            cuepoint_payload["endTime"] = endTime
-
-        color = cuepoint.get("color")
-        if color is not None:
-            try:
-                cuepoint_payload["color"] = _normalize_color(color)
-            except ValueError as exc:
-                errors.partial.append(str(exc))
-
-        normalized_cuepoints.append(cuepoint_payload)
+        cuepoint_payload: dict[str, object] = {}
+        for key, required, expected_type, normalizer, message in _CUE_FIELD_SPEC:
+            value = cuepoint.get(key)
+            if value is None and not required:
+                continue
+            error: str | None = None
+            if expected_type is not None:
+                # Exact type checks are cheaper than isinstance and reject bools
+                kind = type(value)
+                if kind is not expected_type:
+                    if expected_type is float and kind is int:
+                        value = float(cast(int, value))
+                    else:
+                        error = message.format(value=value, kind=kind)
+            elif normalizer is not None:  # pragma: no branch - spec invariant
+                try:
+                    value = normalizer(value)
+                except ValueError as exc:
+                    error = str(exc)
+            if error is None:
+                cuepoint_payload[key] = value
+            elif required:
+                # Invalid required values drop the whole cuepoint
+                add_dropped(error)
+                break
+            else:
+                # Invalid optional values are omitted from the cuepoint
+                add_partial(error)
+        else:
+            add_cuepoint(cast(CuePointUpdate, cuepoint_payload))
     return normalized_cuepoints, errors
 
 
@@ -820,7 +957,7 @@ class TempoMarkerUpdate(TypedDict):
     bpm: float | int
 
 
-@dataclass
+@dataclass(slots=True)
 class TempomarkerErrors:
     """Structured tempomarker validation errors."""
 
@@ -828,6 +965,9 @@ class TempomarkerErrors:
     dropped: list[str] = field(default_factory=list)
 
 
+_TEMPO_REQUIRED: frozenset[str] = frozenset(("startTime", "bpm"))
+
+
 def _normalize_tempomarkers(
     tempomarkers: object,
 ) -> tuple[list[TempoMarkerUpdate], TempomarkerErrors]:
@@ -840,30 +980,40 @@ def _normalize_tempomarkers(
         )
         return normalized_tempomarkers, errors
     seen_start_times: set[float] = set()
+    # Bound appends avoid attribute and method lookups per marker
+    add_marker = normalized_tempomarkers.append
+    add_dropped = errors.dropped.append
     for marker in tempomarkers:
         if not isinstance(marker, dict):
-            errors.dropped.append(f"Invalid entry: {marker}")
+            add_dropped(f"Invalid entry: {marker}")
             continue
-        missing_required = set(("startTime", "bpm")) - marker.keys()
+        missing_required = _TEMPO_REQUIRED - marker.keys()
         if missing_required:
-            errors.dropped.append(f"Missing required keys: {missing_required}")
+            add_dropped(f"Missing required keys: {set(missing_required)}")
             continue
 
+        # Exact type checks are cheaper than isinstance and reject bools
         start_time = marker["startTime"]
-        if not isinstance(start_time, float):
-            errors.dropped.append(f"startTime must be float: {type(start_time)}")
-            continue
-        if start_time in seen_start_times:
-            errors.dropped.append(f"Duplicate startTime: {start_time}")
+        kind = type(start_time)
+        if kind is int:
+            start_time = float(start_time)
+        elif kind is not float:
+            add_dropped(f"startTime must be float: {kind}")
             continue
+        # Detect duplicates by set growth so each startTime is hashed once
+        seen_count = len(seen_start_times)
         seen_start_times.add(start_time)
+        if len(seen_start_times) == seen_count:
+            add_dropped(f"Duplicate startTime: {start_time}")
+            continue
 
         bpm = marker["bpm"]
-        if not isinstance(bpm, (float, int)):
-            errors.dropped.append(f"bpm must be float or int: {type(bpm)}")
+        kind = type(bpm)
+        if kind is not float and kind is not int:
+            add_dropped(f"bpm must be float or int: {kind}")
             continue
 
-        normalized_tempomarkers.append({"startTime": start_time, "bpm": bpm})
+        add_marker({"startTime": start_time, "bpm": bpm})
     return normalized_tempomarkers, errors
 
 
@@ -1,4 +1,9 @@
-"""Playlist helper tools."""
+"""Playlist helper tools.
+
+Playlist trees are parsed JSON, so nodes are exactly ``dict``, child lists are
+exactly ``list`` and names are exactly ``str``. The tree walkers rely on this
+and use ``type(x) is ...`` checks rather than ``isinstance``.
+"""
 
 from __future__ import annotations
 
@@ -12,28 +17,71 @@ def get_path_from_tree(tree: PlaylistResponse, playlist_id: int) -> list[str] |
     if not isinstance(playlist_id, int) or playlist_id < 1:
         return None
 
-    def _walk(node: dict[str, object], path: list[str]) -> list[str] | None:
-        node_id = node.get("id")
-        name = node.get("name")
-        if isinstance(name, str):
-            path = [*path, name]
-        if node_id == playlist_id:
-            return path
-        children = node.get("playlists")
-        if isinstance(children, list):
-            for child in children:
-                if isinstance(child, dict):
-                    found = _walk(cast(dict[str, object], child), path)
-                    if found is not None:
-                        return found
-        return None
+    # Iterative DFS in pre-order. Each visited node records (parent index, name)
+    # so the path is only assembled once, for the matching node.
+    visited: list[tuple[int, str | None]] = []
+    stack: list[tuple[dict[str, object], int]] = [(cast(dict[str, object], tree), -1)]
+    result: list[str] | None = None
+    while stack:
+        node, parent = stack.pop()
+        node_get = node.get
+        name = node_get("name")
+        index = len(visited)
+        visited.append((parent, name if type(name) is str else None))
+        if node_get("id") == playlist_id:
+            result = []
+            while index >= 0:
+                index, segment = visited[index]
+                if segment is not None:
+                    result.append(segment)
+            result.reverse()
+            break
+        children = node_get("playlists")
+        if type(children) is list:
+            # Push in reverse so children are visited in their original order
+            stack.extend(
+                (child, index) for child in reversed(children) if type(child) is dict
+            )
 
-    result = _walk(cast(dict[str, object], tree), [])
     if not result:
         return result
-    if len(result) > 1 and str(result[0]).upper() == "ROOT":
-        return result[1:]
-    return result
+    return _strip_root(result)
+
+
+def build_path_index(tree: PlaylistResponse) -> dict[int, list[str]]:
+    """Return a mapping of playlist ID to path (names) for every node in a tree.
+
+    Use this instead of repeated ``get_path_from_tree`` calls when resolving
+    many IDs against the same tree; the tree is walked only once. When an ID
+    occurs more than once, the first node in pre-order wins, matching
+    ``get_path_from_tree``.
+    """
+    index: dict[int, list[str]] = {}
+    stack: list[tuple[dict[str, object], list[str]]] = [
+        (cast(dict[str, object], tree), [])
+    ]
+    while stack:
+        node, parent_path = stack.pop()
+        node_get = node.get
+        name = node_get("name")
+        path = [*parent_path, name] if type(name) is str else parent_path
+        node_id = node_get("id")
+        if isinstance(node_id, int) and node_id >= 1 and node_id not in index:
+            index[node_id] = _strip_root(path) if path else []
+        children = node_get("playlists")
+        if type(children) is list:
+            stack.extend(
+                (child, path) for child in reversed(children) if type(child) is dict
+            )
+    return index
+
+
+def _strip_root(path: list[str]) -> list[str]:
+    """Return ``path`` without a leading ROOT segment, as a new list."""
+    # Segments are only collected when they are str, so no str() cast is needed
+    if len(path) > 1 and path[0].upper() == "ROOT":
+        return path[1:]
+    return list(path)
 
 
 def choose_playlist(tree: PlaylistResponse) -> dict[str, Any] | None:
@@ -78,19 +126,20 @@ def choose_playlist(tree: PlaylistResponse) -> dict[str, Any] | None:
         if not isinstance(children, list) or not children:
             return current
 
-        current_indent = "  " * (len(stack) - 1)
-        choices: list[dict[str, Any]] = []
-        choices.append({"name": " X Cancel", "value": ("cancel", None)})
-
-        for depth, ancestor in enumerate(stack[:-1]):
-            ancestor_name = ancestor.get("name", "(unnamed)")
-            indent = "  " * depth
-            choices.append(
-                {
-                    "name": f"{indent} V {ancestor_name}",
-                    "value": ("jump", depth),
-                }
-            )
+        # One indent string per stack level, reused for ancestors and children
+        indents = ["  " * depth for depth in range(len(stack) + 1)]
+        current_indent = indents[-2]
+        child_indent = indents[-1]
+        choices: list[dict[str, Any]] = [
+            {"name": " X Cancel", "value": ("cancel", None)}
+        ]
+        choices.extend(
+            {
+                "name": f"{indents[depth]} V {ancestor.get('name', '(unnamed)')}",
+                "value": ("jump", depth),
+            }
+            for depth, ancestor in enumerate(stack[:-1])
+        )
 
         if current.get("id") is not None:
             choices.append(
@@ -99,26 +148,19 @@ def choose_playlist(tree: PlaylistResponse) -> dict[str, Any] | None:
                     "value": ("select", current),
                 }
             )
-        for child in children:
-            if not isinstance(child, dict):
-                continue
-            child_name = child.get("name", "(unnamed)")
-            child_type = str(child.get("type"))
-            child_indent = "  " * len(stack)
-            if child_type == "1":
-                choices.append(
-                    {
-                        "name": f"{child_indent} > {child_name}",
-                        "value": ("folder", child),
-                    }
-                )
-            else:
-                choices.append(
-                    {
-                        "name": f"{child_indent}   {child_name}",
-                        "value": ("item", child),
-                    }
-                )
+        choices.extend(
+            {
+                "name": f"{child_indent} > {child.get('name', '(unnamed)')}",
+                "value": ("folder", child),
+            }
+            if str(child.get("type")) == "1"
+            else {
+                "name": f"{child_indent}   {child.get('name', '(unnamed)')}",
+                "value": ("item", child),
+            }
+            for child in children
+            if type(child) is dict
+        )
 
         result = prompt(
             [
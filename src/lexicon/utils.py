@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterable, Iterator, Sequence, TypeVar
+
+T = TypeVar("T")
 
 
 def unique_in_order(values: Iterable[int]) -> list[int]:
     """Return unique values preserving the original order."""
-    seen: set[int] = set()
-    output: list[int] = []
-    for value in values:
-        if value in seen:
-            continue
-        seen.add(value)
-        output.append(value)
-    return output
+    # dict preserves insertion order, so fromkeys dedupes in a single C pass
+    return list(dict.fromkeys(values))
+
+
+def chunked(values: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+    """Yield consecutive slices of ``values`` with at most ``size`` items."""
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
@@ -0,0 +1,70 @@
+"""Shared TestCase bases for the resource tests."""
+
+import unittest
+
+from tests._fakes import DummyClient
+from tests._patching import stub_methods
+
+
+class DummyClientTestCase(unittest.TestCase):
+    """TestCase sharing one ``DummyClient`` across all tests of a class.
+
+    Resources keep no per-call state and the ``tests._patching`` helpers undo
+    every patch on exit, so subclasses build their resources once in
+    ``setUpClass`` (after calling ``super().setUpClass()``). ``setUp`` only
+    clears the requests recorded by the previous test.
+    """
+
+    client: DummyClient
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.client = DummyClient()
+
+    def setUp(self) -> None:
+        self.client.request_calls.clear()
+
+
+class ResponseShapeCases:
+    """Mixin checking how a resource handles each stubbed response shape.
+
+    Subclasses set ``resource`` and a ``RESPONSE_SHAPE_CALLS`` table of
+    ``(method, stubbed request method, args, kwargs, response, expected)``.
+    """
+
+    RESPONSE_SHAPE_CALLS: list[tuple] = []
+
+    def test_response_shapes(self):
+        for row in self.RESPONSE_SHAPE_CALLS:
+            method, stubbed, args, kwargs, response, expected = row
+            with self.subTest(method=method, response=response, kwargs=kwargs):
+                with stub_methods(self.resource, **{stubbed: response}):
+                    result = getattr(self.resource, method)(*args, **kwargs)
+                self.assertEqual(result, expected)
+
+
+class InvalidInputCases:
+    """Mixin checking validation modes for calls with invalid input.
+
+    Subclasses set ``resource`` and an ``INVALID_INPUT_CALLS`` table of
+    ``(method, args, kwargs, results)``, where ``results`` maps each
+    non-strict mode to the value the call returns. Every call must raise
+    ValueError under ``validation="strict"``.
+    """
+
+    INVALID_INPUT_CALLS: list[tuple] = []
+
+    def test_invalid_inputs_non_strict(self):
+        for method, args, kwargs, results in self.INVALID_INPUT_CALLS:
+            call = getattr(self.resource, method)
+            for mode, expected in results.items():
+                with self.subTest(method=method, args=args, kwargs=kwargs, mode=mode):
+                    self.assertIs(call(*args, validation=mode, **kwargs), expected)
+
+    def test_invalid_inputs_strict(self):
+        for method, args, kwargs, _ in self.INVALID_INPUT_CALLS:
+            with self.subTest(method=method, args=args, kwargs=kwargs):
+                call = getattr(self.resource, method)
+                with self.assertRaises(ValueError):
+                    call(*args, validation="strict", **kwargs)
@@ -0,0 +1,20 @@
+"""Fake collaborators shared by the unit tests."""
+
+import logging
+
+_logger = logging.getLogger("lexicon.tests")
+
+
+class DummyClient:
+    """Stand-in for ``Lexicon`` that records requests and answers ``{}``."""
+
+    __slots__ = ("_logger", "raw_enums", "request_calls")
+
+    def __init__(self) -> None:
+        self._logger = _logger
+        self.raw_enums = True
+        self.request_calls: list[tuple[str, str, object, object, object]] = []
+
+    def request(self, method, path, params=None, json=None, timeout=None):
+        self.request_calls.append((method, path, params, json, timeout))
+        return {}
@@ -0,0 +1,101 @@
+"""Lightweight attribute patching helpers for the unit tests.
+
+``unittest.mock.patch.object`` inspects the target on every enter/exit; these
+helpers only save, set and restore attributes.
+"""
+
+from typing import NamedTuple
+
+_MISSING = object()
+
+
+class AttrPatch:
+    """Context manager that sets attributes on one or more objects at once.
+
+    Targets are collected with ``set``/``stub`` (both chainable), applied in a
+    single ``__enter__`` and restored in reverse order on exit. Attributes
+    that only existed on the class are removed from the instance again.
+    """
+
+    def __init__(self) -> None:
+        self._updates: list[tuple[object, str, object]] = []
+        self._saved: list[tuple[object, str, object]] = []
+
+    def set(self, obj, **values) -> "AttrPatch":
+        self._updates.extend((obj, name, value) for name, value in values.items())
+        return self
+
+    def stub(self, obj, **return_values) -> "AttrPatch":
+        return self.set(
+            obj, **{name: returning(value) for name, value in return_values.items()}
+        )
+
+    def __enter__(self) -> "AttrPatch":
+        for obj, name, value in self._updates:
+            self._saved.append((obj, name, vars(obj).get(name, _MISSING)))
+            setattr(obj, name, value)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        while self._saved:
+            obj, name, value = self._saved.pop()
+            if value is _MISSING:
+                delattr(obj, name)
+            else:
+                setattr(obj, name, value)
+
+
+def set_attrs(obj, **values) -> AttrPatch:
+    """Temporarily set attributes on ``obj``, restoring the originals on exit."""
+    return AttrPatch().set(obj, **values)
+
+
+def stub_methods(obj, **return_values) -> AttrPatch:
+    """Temporarily replace methods on ``obj`` with stubs returning fixed values."""
+    return AttrPatch().stub(obj, **return_values)
+
+
+class Call(NamedTuple):
+    args: tuple
+    kwargs: dict
+
+
+class Recorder:
+    """Callable stub that records each call.
+
+    Returns ``return_value`` on every call, or the next item of ``returns``
+    when a sequence of per-call results is given.
+    """
+
+    def __init__(self, return_value=None, *, returns=None):
+        self.return_value = return_value
+        self._returns = None if returns is None else iter(returns)
+        self.calls: list[Call] = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append(Call(args, kwargs))
+        if self._returns is not None:
+            return next(self._returns)
+        return self.return_value
+
+    @property
+    def call_args(self) -> Call:
+        return self.calls[-1]
+
+
+def returning(value):
+    """Return a stub that returns ``value`` whenever it is called."""
+
+    def stub(*args, **kwargs):
+        return value
+
+    return stub
+
+
+def raising(exc: BaseException):
+    """Return a stub that raises ``exc`` whenever it is called."""
+
+    def stub(*args, **kwargs):
+        raise exc
+
+    return stub
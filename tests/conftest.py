@@ -0,0 +1,10 @@
+"""Shared setup for the unit tests.
+
+The package itself is imported from the development install (``uv sync`` or
+``pip install -e .``). Logging is scoped to the ``lexicon`` namespace so the
+root logger, and pytest's log capture, are left untouched.
+"""
+
+import logging
+
+logging.getLogger("lexicon").setLevel(logging.WARNING)
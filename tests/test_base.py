@@ -1,15 +1,7 @@
 import logging
-import sys
 import unittest
-from pathlib import Path
 
-# Ensure src/ is on sys.path so we can import the package without installation
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-SRC_DIR = PROJECT_ROOT / "src"
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
-
-from lexicon.resources.base import Resource  # noqa: E402
+from lexicon.resources.base import Resource
 
 
 class DummyClient:
@@ -1,30 +1,18 @@
-import logging
-import sys
 import unittest
-from pathlib import Path
 from unittest.mock import patch
 
 import requests
 
-# Ensure src/ is on sys.path so we can import the package without installation
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-SRC_DIR = PROJECT_ROOT / "src"
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
+from lexicon.client import Lexicon, LexiconConnectionError
 
-from lexicon.client import Lexicon, LexiconConnectionError  # noqa: E402
 
+class FakeResponse:
+    __slots__ = ("content", "_json_payload", "_json_error", "_status_error")
 
-logging.basicConfig(
-    level=logging.WARNING,
-    format="%(levelname)s:%(name)s:%(message)s",
-    stream=sys.stdout,
-    force=True,
-)
-
+    def __init__(self, **kwargs):
+        self.reset(**kwargs)
 
-class FakeResponse:
-    def __init__(
+    def reset(
         self, *, content=b"{}", json_payload=None, json_error=False, status_error=None
     ):
         self.content = content
@@ -53,99 +41,73 @@ class FakeSession:
 
 
 class ClientTests(unittest.TestCase):
-    def test_request_path_normalization(self):
-        response = FakeResponse(json_payload={"ok": True})
-        session = FakeSession(response)
-        client = Lexicon(
+    @classmethod
+    def setUpClass(cls):
+        # Lexicon is stateless between requests; share one client and reset the
+        # fake response/session per test instead of rebuilding them.
+        cls.response = FakeResponse()
+        cls.session = FakeSession(cls.response)
+        cls.client = Lexicon(
             host="example.com",
             port=1234,
-            session=session,
+            session=cls.session,
             verify_connection=False,
         )
-        client.request("GET", "tracks")
-        self.assertEqual(len(session.calls), 1)
-        method, url, params, json, timeout = session.calls[0]
+
+    def setUp(self):
+        self.response.reset()
+        self.session.calls.clear()
+
+    def test_request_path_normalization(self):
+        self.response._json_payload = {"ok": True}
+        self.client.request("GET", "tracks")
+        self.assertEqual(len(self.session.calls), 1)
+        method, url, params, json, timeout = self.session.calls[0]
         self.assertEqual(method, "GET")
         self.assertEqual(url, "http://example.com:1234/v1/tracks")
         self.assertIsNone(params)
         self.assertIsNone(json)
-        self.assertEqual(timeout, client.default_timeout)
+        self.assertEqual(timeout, self.client.default_timeout)
 
     def test_request_keeps_v1_prefix(self):
-        response = FakeResponse(json_payload={"ok": True})
-        session = FakeSession(response)
-        client = Lexicon(
-            host="example.com",
-            port=1234,
-            session=session,
-            verify_connection=False,
-        )
-        client.request("GET", "/v1/tracks")
-        self.assertEqual(session.calls[0][1], "http://example.com:1234/v1/tracks")
+        self.response._json_payload = {"ok": True}
+        self.client.request("GET", "/v1/tracks")
+        self.assertEqual(self.session.calls[0][1], "http://example.com:1234/v1/tracks")
 
     def test_request_empty_body_returns_none(self):
-        response = FakeResponse(content=b"")
-        session = FakeSession(response)
-        client = Lexicon(session=session, verify_connection=False)
-        self.assertIsNone(client.request("GET", "/tracks"))
+        self.response.content = b""
+        self.assertIsNone(self.client.request("GET", "/tracks"))
 
     def test_request_non_json_returns_none(self):
-        response = FakeResponse(content=b"not json", json_error=True)
-        session = FakeSession(response)
-        client = Lexicon(session=session, verify_connection=False)
-        self.assertIsNone(client.request("GET", "/tracks"))
+        self.response.content = b"not json"
+        self.response._json_error = True
+        self.assertIsNone(self.client.request("GET", "/tracks"))
 
     def test_request_json_dict_and_list(self):
-        response = FakeResponse(json_payload={"data": 1})
-        session = FakeSession(response)
-        client = Lexicon(session=session, verify_connection=False)
-        self.assertEqual(client.request("GET", "/tracks"), {"data": 1})
-        response._json_payload = [1, 2]
-        self.assertEqual(client.request("GET", "/tracks"), [1, 2])
-        response._json_payload = "not dict"
-        self.assertIsNone(client.request("GET", "/tracks"))
+        self.response._json_payload = {"data": 1}
+        self.assertEqual(self.client.request("GET", "/tracks"), {"data": 1})
+        self.response._json_payload = [1, 2]
+        self.assertEqual(self.client.request("GET", "/tracks"), [1, 2])
+        self.response._json_payload = "not dict"
+        self.assertIsNone(self.client.request("GET", "/tracks"))
 
     def test_request_http_error_returns_none(self):
-        error = requests.HTTPError("bad")
-        response = FakeResponse(json_payload={"message": "problem"}, status_error=error)
-        session = FakeSession(response)
-        client = Lexicon(session=session, verify_connection=False)
-        self.assertIsNone(client.request("GET", "/tracks"))
-
-    def test_request_http_error_uses_error_field(self):
-        error = requests.HTTPError("bad")
-        response = FakeResponse(json_payload={"error": "nope"}, status_error=error)
-        session = FakeSession(response)
-        client = Lexicon(session=session, verify_connection=False)
-        self.assertIsNone(client.request("GET", "/tracks"))
-
-    def test_request_http_error_uses_detail_field(self):
-        error = requests.HTTPError("bad")
-        response = FakeResponse(json_payload={"detail": "nope"}, status_error=error)
-        session = FakeSession(response)
-        client = Lexicon(session=session, verify_connection=False)
-        self.assertIsNone(client.request("GET", "/tracks"))
-
-    def test_request_http_error_with_unexpected_json(self):
-        error = requests.HTTPError("bad")
-        response = FakeResponse(json_payload={"other": "nope"}, status_error=error)
-        session = FakeSession(response)
-        client = Lexicon(session=session, verify_connection=False)
-        self.assertIsNone(client.request("GET", "/tracks"))
-
-    def test_request_http_error_with_non_dict_json(self):
-        error = requests.HTTPError("bad")
-        response = FakeResponse(json_payload=["nope"], status_error=error)
-        session = FakeSession(response)
-        client = Lexicon(session=session, verify_connection=False)
-        self.assertIsNone(client.request("GET", "/tracks"))
-
-    def test_request_http_error_bad_json_body(self):
-        error = requests.HTTPError("bad")
-        response = FakeResponse(json_error=True, status_error=error)
-        session = FakeSession(response)
-        client = Lexicon(session=session, verify_connection=False)
-        self.assertIsNone(client.request("GET", "/tracks"))
+        cases = [
+            ("message", {"message": "problem"}, False),
+            ("error field", {"error": "nope"}, False),
+            ("detail field", {"detail": "nope"}, False),
+            ("unexpected json", {"other": "nope"}, False),
+            ("non-dict json", ["nope"], False),
+            ("bad json body", None, True),
+        ]
+        for label, payload, json_error in cases:
+            with self.subTest(label):
+                self.response.reset(
+                    json_payload=payload,
+                    json_error=json_error,
+                    status_error=requests.HTTPError("bad"),
+                )
+                self.assertIsNone(self.client.request("GET", "/tracks"))
 
     def test_request_http_error_raises_when_enabled(self):
         error = requests.HTTPError("bad")
@@ -201,7 +163,3 @@ class ClientTests(unittest.TestCase):
         session = FakeSession(response)
         with self.assertRaises(LexiconConnectionError):
             Lexicon(session=session)
-
-
-if __name__ == "__main__":
-    unittest.main()
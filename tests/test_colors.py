@@ -1,13 +1,6 @@
-import sys
 import unittest
-from pathlib import Path
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-SRC_DIR = PROJECT_ROOT / "src"
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
-
-from lexicon import color_rgb  # noqa: E402
+from lexicon import color_rgb
 
 
 class ColorRgbTests(unittest.TestCase):
@@ -28,7 +21,3 @@ class ColorRgbTests(unittest.TestCase):
         for component in rgb:
             self.assertIsInstance(component, int)
             self.assertTrue(0 <= component <= 255)
-
-
-if __name__ == "__main__":
-    unittest.main()
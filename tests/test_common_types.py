@@ -1,14 +1,6 @@
-import sys
 import unittest
-from pathlib import Path
 
-# Ensure src/ is on sys.path so we can import the package without installation
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-SRC_DIR = PROJECT_ROOT / "src"
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
-
-from lexicon.resources._common_types import (  # noqa: E402
+from lexicon.resources._common_types import (
     _normalize_color,
     _nearest_color,
     _normalize_id_sequence,
@@ -24,42 +16,24 @@ class CommonTypesTests(unittest.TestCase):
     def test_normalize_color_named(self):
         self.assertEqual(_normalize_color("red"), "red")
 
-    def test_normalize_color_hex_short(self):
-        # #0f0 -> green-ish
-        result = _normalize_color("#0f0")
-        self.assertIn(result, COLORS)
-
-    def test_normalize_color_hex_with_alpha(self):
-        result = _normalize_color("#ff0000ff")
-        self.assertIn(result, COLORS)
-
-    def test_normalize_color_hex_invalid(self):
-        with self.assertRaises(ValueError):
-            _normalize_color("#ggg")
-
-    def test_normalize_color_packed_int(self):
-        self.assertIn(_normalize_color(0xFF0000), COLORS)
-
-    def test_normalize_color_packed_int_with_alpha(self):
-        self.assertIn(_normalize_color(0x1FF0000), COLORS)
-
-    def test_normalize_color_packed_int_negative(self):
-        with self.assertRaises(ValueError):
-            _normalize_color(-1)
-
-    def test_normalize_color_rgb_tuple_int(self):
-        self.assertIn(_normalize_color((255, 0, 0)), COLORS)
-
-    def test_normalize_color_rgb_tuple_float(self):
-        self.assertIn(_normalize_color((1.0, 0.0, 0.0)), COLORS)
-
-    def test_normalize_color_rgb_tuple_invalid(self):
-        with self.assertRaises(ValueError):
-            _normalize_color(("x", 0, 0))
-
-    def test_normalize_color_invalid_type(self):
-        with self.assertRaises(ValueError):
-            _normalize_color({})
+    def test_normalize_color_maps_to_palette(self):
+        cases = [
+            "#0f0",
+            "#ff0000ff",
+            0xFF0000,
+            0x1FF0000,
+            (255, 0, 0),
+            (1.0, 0.0, 0.0),
+        ]
+        for value in cases:
+            with self.subTest(value=value):
+                self.assertIn(_normalize_color(value), COLORS)
+
+    def test_normalize_color_invalid(self):
+        for value in ("#ggg", -1, ("x", 0, 0), {}):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    _normalize_color(value)
 
     def test_nearest_color(self):
         result = _nearest_color((255, 255, 255))
@@ -1,80 +1,63 @@
-import logging
-import sys
-import unittest
-from pathlib import Path
 from unittest.mock import patch
 
-# Ensure src/ is on sys.path so we can import the package without installation
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-SRC_DIR = PROJECT_ROOT / "src"
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
+import lexicon.resources.playlists as playlists_module
+from lexicon.resources.playlists import Playlists
+from tests._cases import DummyClientTestCase, InvalidInputCases
+from tests._patching import Recorder, set_attrs, stub_methods
 
-from lexicon.resources.playlists import Playlists  # noqa: E402
 
+# Shared read-only payloads returned by stubbed requests
+PATCH_OK = {"data": {"id": 1}}
+ROOT_ONLY_TREE = {"id": 1, "name": "ROOT"}
 
-logging.basicConfig(
-    level=logging.WARNING,
-    format="%(levelname)s:%(name)s:%(message)s",
-    stream=sys.stdout,
-    force=True,
-)
 
-
-class DummyClient:
-    def __init__(self) -> None:
-        self._logger = logging.getLogger("lexicon.tests")
-        self.raw_enums = True
-        self.request_calls: list[tuple[str, str, object, object, object]] = []
-
-    def request(self, method, path, params=None, json=None, timeout=None):
-        self.request_calls.append((method, path, params, json, timeout))
-        return {}
-
-
-class PlaylistsTests(unittest.TestCase):
-    def setUp(self) -> None:
-        self.playlists = Playlists(DummyClient())  # type: ignore[arg-type]
+class PlaylistsTests(InvalidInputCases, DummyClientTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.resource = cls.playlists = Playlists(cls.client)  # type: ignore[arg-type]
 
     def test_get_invalid_id_warn(self):
-        with patch.object(self.playlists, "_get") as mocked_get:
+        mocked_get = Recorder()
+        with set_attrs(self.playlists, _get=mocked_get):
             result = self.playlists.get("nope", validation="warn")  # type: ignore[arg-type]
         self.assertIsNone(result)
-        mocked_get.assert_not_called()
+        self.assertEqual(mocked_get.calls, [])
 
     def test_get_invalid_id_strict(self):
         with self.assertRaises(ValueError):
             self.playlists.get(0, validation="strict")
 
     def test_get_invalid_id_off_calls_get(self):
-        with patch.object(self.playlists, "_get") as mocked_get:
+        mocked_get = Recorder()
+        with set_attrs(self.playlists, _get=mocked_get):
             result = self.playlists.get(0, validation="off")
         self.assertIsNone(result)
-        mocked_get.assert_not_called()
+        self.assertEqual(mocked_get.calls, [])
 
     def test_get_response_not_dict(self):
-        with patch.object(self.playlists, "_get", return_value=[]):
+        with stub_methods(self.playlists, _get=[]):
             self.assertIsNone(self.playlists.get(1))
 
     def test_get_playlist_missing(self):
-        with patch.object(self.playlists, "_get", return_value={"data": {}}):
+        with stub_methods(self.playlists, _get={"data": {}}):
             self.assertIsNone(self.playlists.get(1))
 
     def test_get_dedupes_track_ids(self):
         response = {"data": {"playlist": {"id": 1, "trackIds": [1, 2, 2, 3]}}}
-        with patch.object(self.playlists, "_get", return_value=response):
+        with stub_methods(self.playlists, _get=response):
             result = self.playlists.get(1)
         self.assertEqual(result.get("trackIds"), [1, 2, 3])
 
     def test_get_track_ids_no_dedupe(self):
         response = {"data": {"playlist": {"id": 1, "trackIds": [1, 2, 3]}}}
-        with patch.object(self.playlists, "_get", return_value=response):
+        with stub_methods(self.playlists, _get=response):
             result = self.playlists.get(1)
         self.assertEqual(result.get("trackIds"), [1, 2, 3])
 
     def test_get_track_ids_not_list(self):
         response = {"data": {"playlist": {"id": 1, "trackIds": "nope"}}}
-        with patch.object(self.playlists, "_get", return_value=response):
+        with stub_methods(self.playlists, _get=response):
             result = self.playlists.get(1)
         self.assertEqual(result.get("trackIds"), "nope")
 
@@ -87,42 +70,41 @@ class PlaylistsTests(unittest.TestCase):
             self.playlists.get_many([0], validation="strict")
 
     def test_get_many_invalid_ids_off(self):
-        with patch.object(self.playlists, "get", return_value={"id": 1}) as mocked_get:
+        mocked_get = Recorder({"id": 1})
+        with set_attrs(self.playlists, get=mocked_get):
             result = self.playlists.get_many([0, 1], validation="off")
         self.assertEqual(result, [{"id": 1}, {"id": 1}])
-        self.assertEqual(mocked_get.call_count, 2)
+        self.assertEqual(len(mocked_get.calls), 2)
 
     def test_get_many_valid_ids_warn(self):
-        with patch.object(self.playlists, "get", return_value={"id": 1}) as mocked_get:
+        mocked_get = Recorder({"id": 1})
+        with set_attrs(self.playlists, get=mocked_get):
             result = self.playlists.get_many([1, 2], validation="warn")
         self.assertEqual(result, [{"id": 1}, {"id": 1}])
-        self.assertEqual(mocked_get.call_count, 2)
+        self.assertEqual(len(mocked_get.calls), 2)
 
     def test_get_many_off_calls_get(self):
-        with patch.object(self.playlists, "get", return_value={"id": 1}) as mocked_get:
+        mocked_get = Recorder({"id": 1})
+        with set_attrs(self.playlists, get=mocked_get):
             result = self.playlists.get_many([1, 2], validation="off")
         self.assertEqual(result, [{"id": 1}, {"id": 1}])
-        self.assertEqual(mocked_get.call_count, 2)
+        self.assertEqual(len(mocked_get.calls), 2)
 
     def test_list_response_not_dict(self):
-        with patch.object(self.playlists, "_get", return_value=[]):
+        with stub_methods(self.playlists, _get=[]):
             self.assertIsNone(self.playlists.list())
 
     def test_list_missing_root(self):
-        with patch.object(
-            self.playlists, "_get", return_value={"data": {"playlists": []}}
-        ):
+        with stub_methods(self.playlists, _get={"data": {"playlists": []}}):
             self.assertIsNone(self.playlists.list())
 
     def test_list_missing_list(self):
-        with patch.object(
-            self.playlists, "_get", return_value={"data": {"playlists": {}}}
-        ):
+        with stub_methods(self.playlists, _get={"data": {"playlists": {}}}):
             self.assertIsNone(self.playlists.list())
 
     def test_list_returns_root(self):
         response = {"data": {"playlists": [{"id": 1, "name": "ROOT"}]}}
-        with patch.object(self.playlists, "_get", return_value=response):
+        with stub_methods(self.playlists, _get=response):
             result = self.playlists.list()
         self.assertEqual(result.get("id"), 1)
 
@@ -134,36 +116,37 @@ class PlaylistsTests(unittest.TestCase):
             self.playlists.get_path(0, validation="strict")
 
     def test_get_path_invalid_id_off_calls_list(self):
-        with patch.object(self.playlists, "list", return_value=None) as mocked_list:
+        mocked_list = Recorder()
+        with set_attrs(self.playlists, list=mocked_list):
             result = self.playlists.get_path(0, validation="off")
         self.assertIsNone(result)
-        mocked_list.assert_not_called()
+        self.assertEqual(mocked_list.calls, [])
 
     def test_get_path_found(self):
         tree = {"id": 1, "name": "ROOT", "playlists": [{"id": 2, "name": "Genres"}]}
-        with patch.object(self.playlists, "list", return_value=tree):
+        with stub_methods(self.playlists, list=tree):
             result = self.playlists.get_path(2)
         self.assertEqual(result, ["Genres"])
 
     def test_get_path_list_not_dict(self):
-        with patch.object(self.playlists, "list", return_value=None):
+        with stub_methods(self.playlists, list=None):
             self.assertIsNone(self.playlists.get_path(2))
 
     def test_get_path_not_found(self):
         tree = {"id": 1, "name": "ROOT", "playlists": []}
-        with patch.object(self.playlists, "list", return_value=tree):
+        with stub_methods(self.playlists, list=tree):
             result = self.playlists.get_path(2, validation="warn")
         self.assertIsNone(result)
 
-    def test_add_invalid_name(self):
-        self.assertIsNone(self.playlists.add("", playlist_type="2", validation="warn"))
-
-    def test_add_invalid_name_strict(self):
-        with self.assertRaises(ValueError):
-            self.playlists.add("", playlist_type="2", validation="strict")
-
-    def test_add_invalid_name_off(self):
-        self.assertIsNone(self.playlists.add("", playlist_type="2", validation="off"))
+    # (method, args, kwargs, result per non-strict validation mode)
+    INVALID_INPUT_CALLS = [
+        ("add", ("",), {"playlist_type": "2"}, {"warn": None, "off": None}),
+        ("add", ("Name",), {"playlist_type": "2", "parent_id": 0}, {"warn": None}),
+        ("update", (0,), {"name": "x"}, {"warn": None}),
+        ("update", (1,), {"name": ""}, {"warn": None, "off": None}),
+        ("update", (1,), {"parent_id": 0}, {"warn": None, "off": None}),
+        ("update", (1,), {"position": -1}, {"warn": None}),
+    ]
 
     def test_add_invalid_type_strict(self):
         with self.assertRaises(ValueError):
@@ -174,19 +157,6 @@ class PlaylistsTests(unittest.TestCase):
             self.playlists.add("Name", playlist_type="nope", validation="warn")
         )  # type: ignore[arg-type]
 
-    def test_add_invalid_parent(self):
-        self.assertIsNone(
-            self.playlists.add(
-                "Name", playlist_type="2", parent_id=0, validation="warn"
-            )
-        )
-
-    def test_add_invalid_parent_strict(self):
-        with self.assertRaises(ValueError):
-            self.playlists.add(
-                "Name", playlist_type="2", parent_id=0, validation="strict"
-            )
-
     def test_add_invalid_smartlist(self):
         with patch(
             "lexicon.resources.playlists._normalize_smartlist", return_value=None
@@ -207,21 +177,22 @@ class PlaylistsTests(unittest.TestCase):
                 )
 
     def test_add_response_not_dict(self):
-        with patch.object(self.playlists, "_post", return_value=[]):
+        with stub_methods(self.playlists, _post=[]):
             self.assertIsNone(self.playlists.add("Name", playlist_type="2"))
 
     def test_add_response_missing_id(self):
-        with patch.object(self.playlists, "_post", return_value={"data": {}}):
+        with stub_methods(self.playlists, _post={"data": {}}):
             self.assertIsNone(self.playlists.add("Name", playlist_type="2"))
 
     def test_add_with_parent_and_smartlist(self):
         response = {"data": {"id": 11}}
+        mocked_post = Recorder(response)
         with (
             patch(
                 "lexicon.resources.playlists._normalize_smartlist",
                 return_value={"rules": []},
             ),
-            patch.object(self.playlists, "_post", return_value=response) as mocked_post,
+            set_attrs(self.playlists, _post=mocked_post),
         ):
             result = self.playlists.add(
                 "Name", playlist_type="3", parent_id=2, smartlist={"rules": []}
@@ -233,50 +204,16 @@ class PlaylistsTests(unittest.TestCase):
 
     def test_add_success(self):
         response = {"data": {"id": 10}}
-        with patch.object(self.playlists, "_post", return_value=response):
+        with stub_methods(self.playlists, _post=response):
             result = self.playlists.add("Name", playlist_type="2")
         self.assertEqual(result, 10)
 
-    def test_update_invalid_id_strict(self):
-        with self.assertRaises(ValueError):
-            self.playlists.update(0, name="x", validation="strict")
-
-    def test_update_invalid_id_warn(self):
-        self.assertIsNone(self.playlists.update(0, name="x", validation="warn"))
-
-    def test_update_invalid_name_strict(self):
-        with self.assertRaises(ValueError):
-            self.playlists.update(1, name="", validation="strict")
-
-    def test_update_invalid_name_warn(self):
-        self.assertIsNone(self.playlists.update(1, name="", validation="warn"))
-
-    def test_update_invalid_name_off(self):
-        self.assertIsNone(self.playlists.update(1, name="", validation="off"))
-
-    def test_update_invalid_parent_strict(self):
-        with self.assertRaises(ValueError):
-            self.playlists.update(1, parent_id=0, validation="strict")
-
-    def test_update_invalid_parent_warn(self):
-        self.assertIsNone(self.playlists.update(1, parent_id=0, validation="warn"))
-
-    def test_update_invalid_parent_off(self):
-        self.assertIsNone(self.playlists.update(1, parent_id=0, validation="off"))
-
     def test_update_no_updates(self):
-        with patch.object(self.playlists, "_patch") as mocked_patch:
+        mocked_patch = Recorder()
+        with set_attrs(self.playlists, _patch=mocked_patch):
             result = self.playlists.update(1, validation="warn")
         self.assertIsNone(result)
-        mocked_patch.assert_not_called()
-
-    def test_update_invalid_position_warn(self):
-        result = self.playlists.update(1, position=-1, validation="warn")
-        self.assertIsNone(result)
-
-    def test_update_invalid_position_strict(self):
-        with self.assertRaises(ValueError):
-            self.playlists.update(1, position=-1, validation="strict")
+        self.assertEqual(mocked_patch.calls, [])
 
     def test_update_invalid_smartlist_strict(self):
         with patch(
@@ -294,25 +231,23 @@ class PlaylistsTests(unittest.TestCase):
             )
 
     def test_update_response_not_dict(self):
-        with patch.object(self.playlists, "_patch", return_value=[]):
+        with stub_methods(self.playlists, _patch=[]):
             self.assertIsNone(self.playlists.update(1, name="x"))
 
     def test_update_response_missing_playlist(self):
-        with patch.object(self.playlists, "_patch", return_value={"data": {}}):
+        with stub_methods(self.playlists, _patch={"data": {}}):
             self.assertIsNone(self.playlists.update(1, name="x"))
 
     def test_update_with_parent_position_smartlist(self):
-        patch_response = {"data": {"id": 1}}
         get_response = {"id": 1, "trackIds": []}
+        mocked_patch = Recorder(PATCH_OK)
         with (
             patch(
                 "lexicon.resources.playlists._normalize_smartlist",
                 return_value={"rules": []},
             ),
-            patch.object(
-                self.playlists, "_patch", return_value=patch_response
-            ) as mocked_patch,
-            patch.object(self.playlists, "get", return_value=get_response),
+            set_attrs(self.playlists, _patch=mocked_patch),
+            stub_methods(self.playlists, get=get_response),
         ):
             result = self.playlists.update(
                 1, parent_id=2, position=1, smartlist={"rules": []}
@@ -324,32 +259,20 @@ class PlaylistsTests(unittest.TestCase):
         self.assertEqual(payload.get("smartlist"), {"rules": []})
 
     def test_update_success(self):
-        patch_response = {"data": {"id": 1}}
         get_response = {"id": 1, "name": "x", "trackIds": [1, 2]}
-        with (
-            patch.object(self.playlists, "_patch", return_value=patch_response),
-            patch.object(self.playlists, "get", return_value=get_response),
-        ):
+        with stub_methods(self.playlists, _patch=PATCH_OK, get=get_response):
             result = self.playlists.update(1, name="x")
         self.assertEqual(result.get("name"), "x")
 
     def test_update_no_dedupe(self):
-        patch_response = {"data": {"id": 1}}
         get_response = {"id": 1, "trackIds": [1, 2]}
-        with (
-            patch.object(self.playlists, "_patch", return_value=patch_response),
-            patch.object(self.playlists, "get", return_value=get_response),
-        ):
+        with stub_methods(self.playlists, _patch=PATCH_OK, get=get_response):
             result = self.playlists.update(1, name="x")
         self.assertEqual(result.get("trackIds"), [1, 2])
 
     def test_update_track_ids_not_list(self):
-        patch_response = {"data": {"id": 1}}
         get_response = {"id": 1, "trackIds": "nope"}
-        with (
-            patch.object(self.playlists, "_patch", return_value=patch_response),
-            patch.object(self.playlists, "get", return_value=get_response),
-        ):
+        with stub_methods(self.playlists, _patch=PATCH_OK, get=get_response):
             result = self.playlists.update(1, name="x")
         self.assertEqual(result.get("trackIds"), "nope")
 
@@ -364,11 +287,11 @@ class PlaylistsTests(unittest.TestCase):
         self.assertFalse(self.playlists.delete("nope", validation="warn"))  # type: ignore[arg-type]
 
     def test_delete_valid_ids_warn(self):
-        with patch.object(self.playlists, "_delete", return_value={}):
+        with stub_methods(self.playlists, _delete={}):
             self.assertTrue(self.playlists.delete([1], validation="warn"))
 
     def test_delete_success(self):
-        with patch.object(self.playlists, "_delete", return_value={}):
+        with stub_methods(self.playlists, _delete={}):
             self.assertTrue(self.playlists.delete([1, 2], validation="off"))
 
     def test_get_by_path_invalid_path(self):
@@ -394,56 +317,49 @@ class PlaylistsTests(unittest.TestCase):
         )  # type: ignore[arg-type]
 
     def test_get_by_path_response_not_dict(self):
-        with patch.object(self.playlists, "_get", return_value=[]):
+        with stub_methods(self.playlists, _get=[]):
             self.assertIsNone(self.playlists.get_by_path(["Genres"], playlist_type="2"))
 
     def test_get_by_path_success(self):
         response = {"data": {"playlist": {"id": 2}}}
-        with patch.object(self.playlists, "_get", return_value=response):
+        with stub_methods(self.playlists, _get=response):
             result = self.playlists.get_by_path(["Genres"], playlist_type="2")
         self.assertEqual(result.get("id"), 2)
 
     def test_get_by_path_missing_playlist(self):
-        with patch.object(self.playlists, "_get", return_value={"data": {}}):
+        with stub_methods(self.playlists, _get={"data": {}}):
             self.assertIsNone(self.playlists.get_by_path(["Genres"], playlist_type="2"))
 
     def test_choose_no_tree(self):
-        with patch.object(self.playlists, "list", return_value=None):
+        with stub_methods(self.playlists, list=None):
             self.assertIsNone(self.playlists.choose())
 
     def test_choose_selection_not_dict(self):
-        tree = {"id": 1, "name": "ROOT"}
-        with (
-            patch.object(self.playlists, "list", return_value=tree),
-            patch("lexicon.resources.playlists.choose_playlist", return_value=None),
+        with stub_methods(self.playlists, list=ROOT_ONLY_TREE).stub(
+            playlists_module, choose_playlist=None
         ):
             self.assertIsNone(self.playlists.choose())
 
     def test_choose_selection_without_id(self):
-        tree = {"id": 1, "name": "ROOT"}
         selection = {"name": "ROOT"}
-        with (
-            patch.object(self.playlists, "list", return_value=tree),
-            patch(
-                "lexicon.resources.playlists.choose_playlist", return_value=selection
-            ),
+        with stub_methods(self.playlists, list=ROOT_ONLY_TREE).stub(
+            playlists_module, choose_playlist=selection
         ):
             result = self.playlists.choose()
         self.assertEqual(result, selection)
 
     def test_choose_returns_payload(self):
-        tree = {"id": 1, "name": "ROOT"}
+        mocked_choose = Recorder({"id": 2})
+        mocked_get = Recorder({"id": 2})
         with (
-            patch.object(self.playlists, "list", return_value=tree),
-            patch(
-                "lexicon.resources.playlists.choose_playlist", return_value={"id": 2}
-            ) as mocked_choose,
-            patch.object(self.playlists, "get", return_value={"id": 2}) as mocked_get,
+            stub_methods(self.playlists, list=ROOT_ONLY_TREE)
+            .set(self.playlists, get=mocked_get)
+            .set(playlists_module, choose_playlist=mocked_choose)
         ):
             result = self.playlists.choose()
         self.assertEqual(result, {"id": 2})
-        mocked_choose.assert_called_once()
-        mocked_get.assert_called_once()
+        self.assertEqual(len(mocked_choose.calls), 1)
+        self.assertEqual(len(mocked_get.calls), 1)
 
     def test_find_by_name_exact_match(self):
         tree = {
@@ -461,7 +377,7 @@ class PlaylistsTests(unittest.TestCase):
                 {"id": 4, "name": "House"},
             ],
         }
-        with patch.object(self.playlists, "list", return_value=tree):
+        with stub_methods(self.playlists, list=tree):
             results = self.playlists.find_by_name("House")
         self.assertEqual(len(results), 2)
         ids = [r[0] for r in results]
@@ -483,7 +399,7 @@ class PlaylistsTests(unittest.TestCase):
                 {"id": 3, "name": "House"},
             ],
         }
-        with patch.object(self.playlists, "list", return_value=tree):
+        with stub_methods(self.playlists, list=tree):
             results = self.playlists.find_by_name("dnb", exact=False)
         self.assertEqual(len(results), 2)
         ids = [r[0] for r in results]
@@ -498,11 +414,11 @@ class PlaylistsTests(unittest.TestCase):
                 {"id": 1, "name": "House"},
             ],
         }
-        with patch.object(self.playlists, "list", return_value=tree):
+        with stub_methods(self.playlists, list=tree):
             results = self.playlists.find_by_name("Techno")
         self.assertEqual(results, [])
 
     def test_find_by_name_list_fails(self):
-        with patch.object(self.playlists, "list", return_value=None):
+        with stub_methods(self.playlists, list=None):
             results = self.playlists.find_by_name("House")
         self.assertEqual(results, [])
@@ -1,19 +1,11 @@
-import sys
 import unittest
-from pathlib import Path
 
-# Ensure src/ is on sys.path so we can import the package without installation
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-SRC_DIR = PROJECT_ROOT / "src"
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
-
-from lexicon.resources.playlists_types import (  # noqa: E402
+from lexicon.resources.playlists_types import (
     _normalize_playlist_type,
     _normalize_playlist_path,
     _normalize_smartlist,
 )
-import lexicon.resources.playlist_tracks_types as playlist_tracks_types  # noqa: E402, F401
+import lexicon.resources.playlist_tracks_types as playlist_tracks_types
 
 
 class PlaylistsTypesTests(unittest.TestCase):
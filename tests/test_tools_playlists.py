@@ -1,177 +1,157 @@
-import logging
 import sys
 import types
 import unittest
-from pathlib import Path
+from collections import deque
 
-# Ensure src/ is on sys.path so we can import the package without installation
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-SRC_DIR = PROJECT_ROOT / "src"
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
-
-from lexicon.tools.playlists import choose_playlist, get_path_from_tree  # noqa: E402
-
-
-logging.basicConfig(
-    level=logging.WARNING,
-    format="%(levelname)s:%(name)s:%(message)s",
-    stream=sys.stdout,
-    force=True,
+from lexicon.tools.playlists import (
+    build_path_index,
+    choose_playlist,
+    get_path_from_tree,
 )
 
 
-def _install_fake_inquirer(selections):
-    module = types.ModuleType("InquirerPy")
-    resolver = types.ModuleType("InquirerPy.resolver")
-    calls = {"index": 0}
-
-    def prompt(_questions):
-        value = selections[calls["index"]]
-        calls["index"] += 1
-        return value
-
-    resolver.prompt = prompt
-    module.resolver = resolver
-    sys.modules["InquirerPy"] = module
-    sys.modules["InquirerPy.resolver"] = resolver
-    return calls
-
-
 class ToolsPlaylistsTests(unittest.TestCase):
-    def setUp(self) -> None:
-        self.tree = {
-            "id": 1,
-            "name": "ROOT",
-            "type": "1",
-            "playlists": [
-                {
-                    "id": 10,
-                    "name": "Folder",
-                    "type": "1",
-                    "playlists": [
-                        {"id": 11, "name": "Playlist A", "type": "2", "playlists": []},
-                    ],
-                },
-                {"id": 20, "name": "Smart", "type": "3", "playlists": []},
-            ],
+    # Shared across tests: neither the tree walkers nor choose_playlist mutate
+    # it, and tests that need a variant build their own copy.
+    tree = {
+        "id": 1,
+        "name": "ROOT",
+        "type": "1",
+        "playlists": [
+            {
+                "id": 10,
+                "name": "Folder",
+                "type": "1",
+                "playlists": [
+                    {"id": 11, "name": "Playlist A", "type": "2", "playlists": []},
+                ],
+            },
+            {"id": 20, "name": "Smart", "type": "3", "playlists": []},
+        ],
+    }
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Install one fake InquirerPy for the class; its prompt() answers from
+        # a queue that each test refills.
+        cls.selections: deque = deque()
+        module = types.ModuleType("InquirerPy")
+        resolver = types.ModuleType("InquirerPy.resolver")
+        resolver.prompt = lambda _questions: cls.selections.popleft()  # type: ignore[attr-defined]
+        module.resolver = resolver  # type: ignore[attr-defined]
+        cls._saved_modules = {
+            name: sys.modules.get(name)
+            for name in ("InquirerPy", "InquirerPy.resolver")
         }
+        sys.modules["InquirerPy"] = module
+        sys.modules["InquirerPy.resolver"] = resolver
 
-    def tearDown(self) -> None:
-        sys.modules.pop("InquirerPy", None)
-        sys.modules.pop("InquirerPy.resolver", None)
+    @classmethod
+    def tearDownClass(cls) -> None:
+        for name, saved in cls._saved_modules.items():
+            if saved is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = saved
 
-    def test_get_path_from_tree_invalid_id(self):
-        self.assertIsNone(get_path_from_tree(self.tree, 0))
-        self.assertIsNone(get_path_from_tree(self.tree, -1))
-        self.assertIsNone(get_path_from_tree(self.tree, "nope"))  # type: ignore[arg-type]
-
-    def test_get_path_from_tree_found(self):
-        path = get_path_from_tree(self.tree, 11)
-        self.assertEqual(path, ["Folder", "Playlist A"])
-
-    def test_get_path_from_tree_not_found(self):
-        self.assertIsNone(get_path_from_tree(self.tree, 999))
+    def setUp(self) -> None:
+        self.selections.clear()
 
-    def test_get_path_from_tree_name_not_str(self):
-        tree = {
+    def test_get_path_from_tree_cases(self):
+        name_not_str = {
             "id": 1,
             "name": None,
             "type": "1",
             "playlists": [{"id": 2, "name": "Child", "type": "2", "playlists": []}],
         }
-        self.assertEqual(get_path_from_tree(tree, 2), ["Child"])
-
-    def test_get_path_from_tree_children_not_list(self):
-        tree = {
-            "id": 1,
-            "name": "ROOT",
-            "type": "1",
-            "playlists": "nope",
-        }
-        self.assertIsNone(get_path_from_tree(tree, 2))
-
-    def test_get_path_from_tree_child_not_dict(self):
-        tree = {
-            "id": 1,
-            "name": "ROOT",
+        children_not_list = {"id": 1, "name": "ROOT", "type": "1", "playlists": "nope"}
+        child_not_dict = {"id": 1, "name": "ROOT", "type": "1", "playlists": ["bad"]}
+        without_root = {
+            "id": 5,
+            "name": "Library",
             "type": "1",
-            "playlists": ["bad"],
+            "playlists": [{"id": 6, "name": "Child", "type": "2", "playlists": []}],
         }
-        self.assertIsNone(get_path_from_tree(tree, 2))
-
-    def test_choose_playlist_cancel(self):
-        _install_fake_inquirer([{"selection": ("cancel", None)}])
-        self.assertIsNone(choose_playlist(self.tree))
-
-    def test_choose_playlist_select_current(self):
-        _install_fake_inquirer([{"selection": ("select", self.tree)}])
-        self.assertEqual(choose_playlist(self.tree), self.tree)
-
-    def test_choose_playlist_folder_then_item(self):
-        _install_fake_inquirer(
-            [
-                {"selection": ("folder", self.tree["playlists"][0])},
-                {"selection": ("item", self.tree["playlists"][0]["playlists"][0])},
-            ]
-        )
-        result = choose_playlist(self.tree)
-        self.assertEqual(result["id"], 11)
-
-    def test_choose_playlist_invalid_selection_tuple(self):
-        _install_fake_inquirer([{"selection": None}])
-        self.assertIsNone(choose_playlist(self.tree))
-
-    def test_choose_playlist_invalid_selection_pops_stack(self):
-        _install_fake_inquirer(
-            [
-                {"selection": ("folder", self.tree["playlists"][0])},
-                {"selection": None},
-                {"selection": ("cancel", None)},
-            ]
-        )
-        self.assertIsNone(choose_playlist(self.tree))
-
-    def test_choose_playlist_non_dict_result(self):
-        _install_fake_inquirer(["cancel"])
-        self.assertIsNone(choose_playlist(self.tree))
-
-    def test_choose_playlist_jump(self):
-        _install_fake_inquirer(
-            [
-                {"selection": ("folder", self.tree["playlists"][0])},
-                {"selection": ("jump", 0)},
-                {"selection": ("item", self.tree["playlists"][1])},
-            ]
-        )
-        result = choose_playlist(self.tree)
-        self.assertEqual(result["id"], 20)
-
-    def test_choose_playlist_select_invalid_payload(self):
-        _install_fake_inquirer([{"selection": ("select", "nope")}])
-        self.assertIsNone(choose_playlist(self.tree))
-
-    def test_choose_playlist_item_invalid_payload(self):
-        _install_fake_inquirer([{"selection": ("item", "nope")}])
-        self.assertIsNone(choose_playlist(self.tree))
-
-    def test_choose_playlist_jump_invalid_payload(self):
-        _install_fake_inquirer(
-            [
-                {"selection": ("jump", "nope")},
-                {"selection": ("cancel", None)},
-            ]
-        )
-        self.assertIsNone(choose_playlist(self.tree))
-
-    def test_choose_playlist_folder_invalid_payload(self):
-        _install_fake_inquirer(
-            [
-                {"selection": ("folder", "nope")},
-                {"selection": ("cancel", None)},
-            ]
-        )
-        self.assertIsNone(choose_playlist(self.tree))
+        # (label, tree, playlist_id, expected path)
+        cases = [
+            ("zero id", self.tree, 0, None),
+            ("negative id", self.tree, -1, None),
+            ("non-int id", self.tree, "nope", None),
+            ("found", self.tree, 11, ["Folder", "Playlist A"]),
+            ("not found", self.tree, 999, None),
+            ("name not str", name_not_str, 2, ["Child"]),
+            ("children not list", children_not_list, 2, None),
+            ("child not dict", child_not_dict, 2, None),
+            ("without root", without_root, 6, ["Library", "Child"]),
+        ]
+        for label, tree, playlist_id, expected in cases:
+            with self.subTest(label):
+                self.assertEqual(
+                    get_path_from_tree(tree, playlist_id),  # type: ignore[arg-type]
+                    expected,
+                )
+
+    def test_choose_playlist_prompt_sequences(self):
+        folder = self.tree["playlists"][0]
+        playlist_a = folder["playlists"][0]
+        smart = self.tree["playlists"][1]
+        # (label, prompt results in order, expected playlist id or None)
+        cases = [
+            ("cancel", [{"selection": ("cancel", None)}], None),
+            ("select current", [{"selection": ("select", self.tree)}], 1),
+            (
+                "folder then item",
+                [
+                    {"selection": ("folder", folder)},
+                    {"selection": ("item", playlist_a)},
+                ],
+                11,
+            ),
+            ("invalid selection tuple", [{"selection": None}], None),
+            (
+                "invalid selection pops stack",
+                [
+                    {"selection": ("folder", folder)},
+                    {"selection": None},
+                    {"selection": ("cancel", None)},
+                ],
+                None,
+            ),
+            ("non-dict result", ["cancel"], None),
+            (
+                "jump",
+                [
+                    {"selection": ("folder", folder)},
+                    {"selection": ("jump", 0)},
+                    {"selection": ("item", smart)},
+                ],
+                20,
+            ),
+            ("select invalid payload", [{"selection": ("select", "nope")}], None),
+            ("item invalid payload", [{"selection": ("item", "nope")}], None),
+            (
+                "jump invalid payload",
+                [{"selection": ("jump", "nope")}, {"selection": ("cancel", None)}],
+                None,
+            ),
+            (
+                "folder invalid payload",
+                [{"selection": ("folder", "nope")}, {"selection": ("cancel", None)}],
+                None,
+            ),
+            (
+                "unknown action falls through",
+                [{"selection": ("noop", None)}, {"selection": ("cancel", None)}],
+                None,
+            ),
+        ]
+        for label, prompt_results, expected_id in cases:
+            with self.subTest(label):
+                self.selections.clear()
+                self.selections.extend(prompt_results)
+                result = choose_playlist(self.tree)
+                self.assertEqual(None if result is None else result["id"], expected_id)
+                self.assertFalse(self.selections)
 
     def test_choose_playlist_current_without_id(self):
         tree = {
@@ -180,39 +160,67 @@ class ToolsPlaylistsTests(unittest.TestCase):
             "type": "1",
             "playlists": [{"id": 2, "name": "Child", "type": "2", "playlists": []}],
         }
-        _install_fake_inquirer([{"selection": ("item", tree["playlists"][0])}])
+        self.selections.extend([{"selection": ("item", tree["playlists"][0])}])
         result = choose_playlist(tree)
         self.assertEqual(result["id"], 2)
 
-    def test_choose_playlist_unknown_action_falls_through(self):
-        _install_fake_inquirer(
-            [
-                {"selection": ("noop", None)},
-                {"selection": ("cancel", None)},
-            ]
-        )
-        self.assertIsNone(choose_playlist(self.tree))
-
     def test_choose_playlist_child_not_dict(self):
         tree = dict(self.tree)
         tree["playlists"] = ["bad-child"]
-        _install_fake_inquirer([{"selection": ("cancel", None)}])
+        self.selections.extend([{"selection": ("cancel", None)}])
         self.assertIsNone(choose_playlist(tree))
 
     def test_choose_playlist_leaf_returns_current(self):
         tree = {"id": 99, "name": "Leaf", "type": "2", "playlists": []}
-        _install_fake_inquirer([])
         self.assertEqual(choose_playlist(tree), tree)
 
-    def test_get_path_from_tree_without_root(self):
+    def test_get_path_from_tree_deep_tree(self):
+        depth = 2000
+        tree = {"id": 1, "name": "ROOT", "type": "1", "playlists": []}
+        node = tree
+        for i in range(2, depth + 2):
+            child = {"id": i, "name": f"N{i}", "type": "1", "playlists": []}
+            node["playlists"].append(child)
+            node = child
+        path = get_path_from_tree(tree, depth + 1)
+        self.assertEqual(len(path), depth)
+        self.assertEqual(path[-1], f"N{depth + 1}")
+
+    def test_get_path_from_tree_preorder_first_match(self):
         tree = {
-            "id": 5,
-            "name": "Library",
+            "id": 1,
+            "name": "ROOT",
             "type": "1",
-            "playlists": [{"id": 6, "name": "Child", "type": "2", "playlists": []}],
+            "playlists": [
+                {
+                    "id": 2,
+                    "name": "A",
+                    "type": "1",
+                    "playlists": [{"id": 5, "name": "Deep", "type": "2"}],
+                },
+                {"id": 5, "name": "Shallow", "type": "2"},
+            ],
         }
-        self.assertEqual(get_path_from_tree(tree, 6), ["Library", "Child"])
-
-
-if __name__ == "__main__":
-    unittest.main()
+        self.assertEqual(get_path_from_tree(tree, 5), ["A", "Deep"])
+
+    def test_build_path_index(self):
+        index = build_path_index(self.tree)
+        self.assertEqual(index[11], ["Folder", "Playlist A"])
+        self.assertEqual(index[10], ["Folder"])
+        self.assertEqual(index[1], ["ROOT"])
+        self.assertNotIn(999, index)
+        for playlist_id, path in index.items():
+            self.assertEqual(get_path_from_tree(self.tree, playlist_id), path)
+
+    def test_build_path_index_skips_invalid_nodes(self):
+        tree = {
+            "id": 1,
+            "name": None,
+            "type": "1",
+            "playlists": [
+                "bad",
+                {"id": 0, "name": "Zero", "type": "2"},
+                {"id": 2, "name": "Child", "type": "1", "playlists": "bad"},
+            ],
+        }
+        self.assertEqual(build_path_index(tree), {1: [], 2: ["Child"]})
@@ -1,13 +1,6 @@
-import sys
 import unittest
-from pathlib import Path
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-SRC_DIR = PROJECT_ROOT / "src"
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
-
-from lexicon.tools.tempo import beats_to_seconds, seconds_to_beats  # noqa: E402
+from lexicon.tools.tempo import beats_to_seconds, seconds_to_beats
 
 
 class SecondsToBeatsTests(unittest.TestCase):
@@ -73,7 +66,3 @@ class BeatsToSecondsTests(unittest.TestCase):
     def test_no_markers_raises(self):
         with self.assertRaises(ValueError):
             beats_to_seconds(0.0, [])
-
-
-if __name__ == "__main__":
-    unittest.main()
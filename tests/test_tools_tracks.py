@@ -1,13 +1,6 @@
-import sys
 import unittest
-from pathlib import Path
 
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-SRC_DIR = PROJECT_ROOT / "src"
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
-
-from lexicon.tools.tracks import align_tempomarker_bpms  # noqa: E402
+from lexicon.tools.tracks import align_tempomarker_bpms
 
 
 class AlignTempomarkerBpmsTests(unittest.TestCase):
@@ -97,7 +90,3 @@ class AlignTempomarkerBpmsTests(unittest.TestCase):
         result = align_tempomarker_bpms(markers)
         self.assertEqual(result[0]["bpm"], 120.0)
         self.assertEqual(result[1]["bpm"], 130.0)
-
-
-if __name__ == "__main__":
-    unittest.main()
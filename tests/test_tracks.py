@@ -1,59 +1,64 @@
-import logging
-import sys
 from datetime import date, datetime
 from typing import Mapping
 import unittest
-from pathlib import Path
-from unittest.mock import patch
 
-# Ensure src/ is on sys.path so we can import the package without installation
-PROJECT_ROOT = Path(__file__).resolve().parents[1]
-SRC_DIR = PROJECT_ROOT / "src"
-if str(SRC_DIR) not in sys.path:
-    sys.path.insert(0, str(SRC_DIR))
-
-from lexicon.resources.tracks import Tracks  # noqa: E402
-from lexicon.resources.tracks_types import (  # noqa: E402
+import lexicon.resources.tracks as tracks_module
+from lexicon.resources.tracks import Tracks
+from lexicon.resources.tracks_types import (
     FilterField,
     TrackEditField,
     _normalize_edits,
     _normalize_fields,
     _normalize_filters,
     _normalize_sorts,
-    _normalize_bool,
-    _normalize_text,
-    _normalize_number,
-    _normalize_date,
+    _normalize_bool_value,
+    _normalize_text_filter,
+    _normalize_text_edit,
+    _normalize_number_filter,
+    _normalize_number_edit,
+    _normalize_date_filter,
+    _normalize_date_edit,
     _normalize_tag_filter,
     _normalize_tags,
     _normalize_cuepoint_type,
     _normalize_cuepoints,
     _normalize_tempomarkers,
+    _date_filter_str,
 )
-
-
-logging.basicConfig(
-    level=logging.WARNING,
-    format="%(levelname)s:%(name)s:%(message)s",
-    stream=sys.stdout,
-    force=True,
+from tests._cases import DummyClientTestCase
+from tests._patching import Recorder, raising, returning, set_attrs, stub_methods
+
+
+# Shared read-only results returned by stubbed requests and normalisers
+SEARCH_FILTER = {"title": "a"}
+SEARCH_SORT = [("title", "asc")]
+EMPTY_SEARCH_RESPONSE = {"data": {"tracks": [], "total": 0}}
+SORTS_INVALID_FIELDS = ([], ["bad"], None)
+SORTS_VALUE_ERRORS = ([], None, ["oops"])
+FIELDS_INVALID_STRING = (["id"], "bad", None)
+FIELDS_INVALID_NAMES = (["id"], None, ["bad"])
+FILTERS_INVALID_FIELDS = ({}, ["bad"], None)
+FILTERS_VALUE_ERRORS = ({}, None, ["oops"])
+EDITS_VALUE_ERRORS = ({"title": "x"}, None, ["oops"])
+EDITS_EMPTY = ({}, None, None)
+# _paged_tracks_json copies tracks before returning them, so pages are shared
+TWO_PAGE_RESPONSES = (
+    {"data": {"tracks": [{"id": 1}, {"id": 2}], "total": 3, "limit": 2}},
+    {"data": {"tracks": [{"id": 3}], "total": 3, "limit": 2}},
 )
+FULL_PAGE_RESPONSE = {"data": {"tracks": [{"id": i} for i in range(1000)]}}
 
 
-class DummyClient:
-    def __init__(self) -> None:
-        self._logger = logging.getLogger("lexicon.tests")
-        self.raw_enums = True
-        self.request_calls: list[tuple[str, str, object, object, object]] = []
+def _error_fields(value_errors):
+    """Return the field names of "field: message" normalizer errors."""
+    return {err.partition(":")[0] for err in value_errors or ()}
 
-    def request(self, method, path, params=None, json=None, timeout=None):
-        self.request_calls.append((method, path, params, json, timeout))
-        return {}
 
-
-class TracksTests(unittest.TestCase):
-    def setUp(self) -> None:
-        self.tracks = Tracks(DummyClient())  # type: ignore[arg-type]
+class TracksTests(DummyClientTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.tracks = Tracks(cls.client)  # type: ignore[arg-type]
 
     def test_get_invalid_strict_raises(self):
         with self.assertRaises(ValueError):
@@ -61,30 +66,32 @@ class TracksTests(unittest.TestCase):
 
     def test_get_success(self):
         response = {"data": {"track": {"id": 1}}}
-        with patch.object(self.tracks, "_get", return_value=response):
+        with stub_methods(self.tracks, _get=response):
             result = self.tracks.get(1)
         self.assertEqual(result, {"id": 1})
 
     def test_get_response_not_dict(self):
-        with patch.object(self.tracks, "_get", return_value=[]):
+        with stub_methods(self.tracks, _get=[]):
             self.assertIsNone(self.tracks.get(1))
 
     def test_get_missing_track(self):
-        with patch.object(self.tracks, "_get", return_value={"data": {}}):
+        with stub_methods(self.tracks, _get={"data": {}}):
             self.assertIsNone(self.tracks.get(1))
 
     def test_get_invalid_warn_returns_none(self):
-        with patch.object(self.tracks, "_get") as mocked_get:
+        mocked_get = Recorder()
+        with set_attrs(self.tracks, _get=mocked_get):
             result = self.tracks.get("nope", validation="warn")  # type: ignore[arg-type]
         self.assertIsNone(result)
-        mocked_get.assert_not_called()
+        self.assertEqual(mocked_get.calls, [])
 
     def test_get_invalid_off_calls_get(self):
         response = {"data": {"track": {"id": 1}}}
-        with patch.object(self.tracks, "_get", return_value=response) as mocked_get:
+        mocked_get = Recorder(response)
+        with set_attrs(self.tracks, _get=mocked_get):
             result = self.tracks.get(0, validation="off")
         self.assertEqual(result, {"id": 1})
-        mocked_get.assert_called_once()
+        self.assertEqual(len(mocked_get.calls), 1)
 
     def test_get_many_empty(self):
         self.assertIsNone(self.tracks.get_many([]))
@@ -102,14 +109,13 @@ class TracksTests(unittest.TestCase):
         self.assertEqual(result, [None])
 
     def test_get_many_no_all_ids_fallback(self):
-        with (
-            patch.object(self.tracks, "list", return_value=None) as mocked_list,
-            patch.object(self.tracks, "get", return_value={"id": 1}) as mocked_get,
-        ):
+        mocked_list = Recorder()
+        mocked_get = Recorder({"id": 1})
+        with set_attrs(self.tracks, list=mocked_list, get=mocked_get):
             result = self.tracks.get_many([1, 0, 2])
         self.assertEqual(result, [{"id": 1}, {"id": 1}])
-        mocked_list.assert_called()
-        self.assertEqual(mocked_get.call_count, 2)
+        self.assertTrue(mocked_list.calls)
+        self.assertEqual(len(mocked_get.calls), 2)
 
     def test_get_many_large_request_trims(self):
         def list_side_effect(*args, **kwargs):
@@ -117,533 +123,180 @@ class TracksTests(unittest.TestCase):
                 return [{"id": i} for i in range(1, 21)]
             return [{"id": 1}, {"id": 2}, {"id": 3}]
 
-        with patch.object(self.tracks, "list", side_effect=list_side_effect):
+        with set_attrs(self.tracks, list=list_side_effect):
             result = self.tracks.get_many([1, 2, 3])
         self.assertEqual(result, [{"id": 1}, {"id": 2}, {"id": 3}])
 
     def test_get_many_small_request_uses_get(self):
+        mocked_get = Recorder({"id": 1})
         with (
-            patch.object(
-                self.tracks, "list", return_value=[{"id": i} for i in range(100)]
-            ),
-            patch.object(self.tracks, "get", return_value={"id": 1}) as mocked_get,
+            stub_methods(self.tracks, list=[{"id": i} for i in range(100)]),
+            set_attrs(self.tracks, get=mocked_get),
         ):
             result = self.tracks.get_many([1, 2])
         self.assertEqual(result, [{"id": 1}, {"id": 1}])
-        self.assertEqual(mocked_get.call_count, 2)
+        self.assertEqual(len(mocked_get.calls), 2)
 
+    def test_get_many_strategy_per_id_skips_probe(self):
+        mocked_list = Recorder()
+        mocked_get = Recorder({"id": 1})
+        with set_attrs(self.tracks, list=mocked_list, get=mocked_get):
+            result = self.tracks.get_many([1, 2], strategy="per_id")
+        self.assertEqual(result, [{"id": 1}, {"id": 1}])
+        self.assertEqual(mocked_list.calls, [])
+        self.assertEqual(len(mocked_get.calls), 2)
+
+    def test_get_many_strategy_bulk_skips_probe(self):
+        mocked_list = Recorder([{"id": 1}, {"id": 2}])
+        mocked_get = Recorder()
+        with set_attrs(self.tracks, list=mocked_list, get=mocked_get):
+            result = self.tracks.get_many([2, 3], strategy="bulk")
+        self.assertEqual(result, [{"id": 2}, None])
+        self.assertEqual(len(mocked_list.calls), 1)
+        self.assertEqual(mocked_list.call_args.kwargs.get("fields"), "all")
+        self.assertEqual(mocked_get.calls, [])
+
+    def test_get_many_invalid_strategy_strict(self):
+        with self.assertRaises(ValueError):
+            self.tracks.get_many([1], strategy="bad", validation="strict")  # type: ignore[arg-type]
+
+    def test_get_many_invalid_strategy_warn_uses_auto(self):
+        mocked_list = Recorder()
+        with (
+            set_attrs(self.tracks, list=mocked_list),
+            stub_methods(self.tracks, get={"id": 1}),
+        ):
+            result = self.tracks.get_many([1], strategy="bad")  # type: ignore[arg-type]
+        self.assertEqual(result, [{"id": 1}])
+        self.assertEqual(len(mocked_list.calls), 1)
 
-class TracksValidationTests(unittest.TestCase):
-    def setUp(self) -> None:
-        self.tracks = Tracks(DummyClient())  # type: ignore[arg-type]
 
-    def test_list_invalid_source_strict_raises(self):
-        with patch.object(self.tracks, "_paged_tracks_json") as mocked_paged:
+class TracksValidationTests(DummyClientTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.tracks = Tracks(cls.client)  # type: ignore[arg-type]
+
+    def test_list_invalid_source_modes(self):
+        # validation mode -> source sent to the API (None: omitted)
+        cases = [("warn", None), ("off", "bad")]
+        mocked_paged = Recorder([])
+        with set_attrs(self.tracks, _paged_tracks_json=mocked_paged):
             with self.assertRaises(ValueError):
                 self.tracks.list(source="bad", validation="strict")  # type: ignore[arg-type]
-        mocked_paged.assert_not_called()
-
-    def test_list_invalid_source_warn(self):
-        with patch.object(
-            self.tracks, "_paged_tracks_json", return_value=[]
-        ) as mocked_paged:
-            self.tracks.list(source="bad", validation="warn")  # type: ignore[arg-type]
-        payload = mocked_paged.call_args[0][1]
-        self.assertNotIn("source", payload)
-
-    def test_list_invalid_source_off(self):
-        with patch.object(
-            self.tracks, "_paged_tracks_json", return_value=[]
-        ) as mocked_paged:
-            self.tracks.list(source="bad", validation="off")  # type: ignore[arg-type]
-        payload = mocked_paged.call_args[0][1]
-        self.assertEqual(payload.get("source"), "bad")
+            self.assertEqual(mocked_paged.calls, [])
+            for mode, expected in cases:
+                mocked_paged.calls.clear()
+                with self.subTest(mode=mode):
+                    self.tracks.list(source="bad", validation=mode)  # type: ignore[arg-type]
+                    self.assertEqual(len(mocked_paged.calls), 1)
+                    payload = mocked_paged.call_args.args[1]
+                    self.assertEqual(payload.get("source"), expected)
 
     def test_list_source_none_skips_source(self):
-        with patch.object(
-            self.tracks, "_paged_tracks_json", return_value=[]
-        ) as mocked_paged:
+        mocked_paged = Recorder([])
+        with set_attrs(self.tracks, _paged_tracks_json=mocked_paged):
             self.tracks.list(source=None, validation="warn")
-        payload = mocked_paged.call_args[0][1]
+        payload = mocked_paged.call_args.args[1]
         self.assertNotIn("source", payload)
 
     def test_list_validation_off_passes_sort(self):
         sort_input = [{"field": "title", "dir": "asc"}]
-        with patch.object(
-            self.tracks, "_paged_tracks_json", return_value=[]
-        ) as mocked_paged:
+        mocked_paged = Recorder([])
+        with set_attrs(self.tracks, _paged_tracks_json=mocked_paged):
             self.tracks.list(sort=sort_input, validation="off")
-        payload = mocked_paged.call_args[0][1]
+        payload = mocked_paged.call_args.args[1]
         self.assertEqual(payload.get("sort"), sort_input)
 
-    def test_list_sort_invalid_fields_warn(self):
-        with (
-            patch(
-                "lexicon.resources.tracks._normalize_sorts",
-                return_value=([], ["bad"], None),
-            ),
-            patch.object(
-                self.tracks, "_paged_tracks_json", return_value=[]
-            ) as mocked_paged,
-        ):
-            self.tracks.list(sort=[("title", "asc")], validation="warn")
-        payload = mocked_paged.call_args[0][1]
-        self.assertNotIn("sort", payload)
-
-    def test_list_sort_invalid_fields_strict(self):
-        with patch(
-            "lexicon.resources.tracks._normalize_sorts",
-            return_value=([], ["bad"], None),
-        ):
-            with self.assertRaises(ValueError):
-                self.tracks.list(sort=[("title", "asc")], validation="strict")
-
-    def test_list_sort_value_errors_warn(self):
-        with (
-            patch(
-                "lexicon.resources.tracks._normalize_sorts",
-                return_value=([], None, ["oops"]),
-            ),
-            patch.object(
-                self.tracks, "_paged_tracks_json", return_value=[]
-            ) as mocked_paged,
-        ):
-            self.tracks.list(sort=[("title", "asc")], validation="warn")
-        payload = mocked_paged.call_args[0][1]
-        self.assertNotIn("sort", payload)
-
-    def test_list_sort_value_errors_strict(self):
-        with patch(
-            "lexicon.resources.tracks._normalize_sorts",
-            return_value=([], None, ["oops"]),
-        ):
-            with self.assertRaises(ValueError):
-                self.tracks.list(sort=[("title", "asc")], validation="strict")
-
-    def test_list_sort_exception_warn(self):
-        with (
-            patch(
-                "lexicon.resources.tracks._normalize_sorts",
-                side_effect=ValueError("bad"),
-            ),
-            patch.object(
-                self.tracks, "_paged_tracks_json", return_value=[]
-            ) as mocked_paged,
-        ):
-            self.tracks.list(sort=[("title", "asc")], validation="warn")
-        payload = mocked_paged.call_args[0][1]
-        self.assertNotIn("sort", payload)
-
-    def test_list_sort_exception_strict(self):
-        with patch(
-            "lexicon.resources.tracks._normalize_sorts", side_effect=ValueError("bad")
-        ):
-            with self.assertRaises(ValueError):
-                self.tracks.list(sort=[("title", "asc")], validation="strict")
-
     def test_list_sort_payload_set(self):
+        mocked_paged = Recorder([])
         with (
-            patch(
-                "lexicon.resources.tracks._normalize_sorts",
-                return_value=([{"field": "title"}], None, None),
+            stub_methods(
+                tracks_module, _normalize_sorts=([{"field": "title"}], None, None)
             ),
-            patch.object(
-                self.tracks, "_paged_tracks_json", return_value=[]
-            ) as mocked_paged,
+            set_attrs(self.tracks, _paged_tracks_json=mocked_paged),
         ):
             self.tracks.list(sort=[("title", "asc")], validation="warn")
-        payload = mocked_paged.call_args[0][1]
+        payload = mocked_paged.call_args.args[1]
         self.assertEqual(payload.get("sort"), [{"field": "title"}])
 
-    def test_list_fields_invalid_string_warn(self):
-        with (
-            patch(
-                "lexicon.resources.tracks._normalize_fields",
-                return_value=(["id"], "bad", None),
-            ),
-            patch.object(
-                self.tracks, "_paged_tracks_json", return_value=[]
-            ) as mocked_paged,
-        ):
-            self.tracks.list(fields=["id"], validation="warn")
-        payload = mocked_paged.call_args[0][1]
-        self.assertEqual(payload.get("fields"), ["id"])
-
-    def test_list_fields_invalid_string_strict(self):
-        with patch(
-            "lexicon.resources.tracks._normalize_fields",
-            return_value=(["id"], "bad", None),
-        ):
-            with self.assertRaises(ValueError):
-                self.tracks.list(fields=["id"], validation="strict")
-
-    def test_list_fields_invalid_names_warn(self):
-        with (
-            patch(
-                "lexicon.resources.tracks._normalize_fields",
-                return_value=(["id"], None, ["bad"]),
-            ),
-            patch.object(
-                self.tracks, "_paged_tracks_json", return_value=[]
-            ) as mocked_paged,
-        ):
-            self.tracks.list(fields=["id"], validation="warn")
-        payload = mocked_paged.call_args[0][1]
-        self.assertEqual(payload.get("fields"), ["id"])
-
-    def test_list_fields_invalid_names_strict(self):
-        with patch(
-            "lexicon.resources.tracks._normalize_fields",
-            return_value=(["id"], None, ["bad"]),
-        ):
-            with self.assertRaises(ValueError):
-                self.tracks.list(fields=["id"], validation="strict")
+    LIST_INPUTS = {"sort": [("title", "asc")], "fields": ["id"]}
+
+    # (normaliser, stub, list() argument, value sent in warn mode)
+    LIST_NORMALIZER_FAILURES = [
+        ("_normalize_sorts", returning(SORTS_INVALID_FIELDS), "sort", None),
+        ("_normalize_sorts", returning(SORTS_VALUE_ERRORS), "sort", None),
+        ("_normalize_sorts", raising(ValueError("bad")), "sort", None),
+        ("_normalize_fields", returning(FIELDS_INVALID_STRING), "fields", ["id"]),
+        ("_normalize_fields", returning(FIELDS_INVALID_NAMES), "fields", ["id"]),
+    ]
+
+    def test_list_normalizer_failures(self):
+        mocked_paged = Recorder([])
+        with set_attrs(self.tracks, _paged_tracks_json=mocked_paged):
+            for row, (name, stub, key, expected) in enumerate(
+                self.LIST_NORMALIZER_FAILURES
+            ):
+                kwargs = {key: self.LIST_INPUTS[key]}
+                mocked_paged.calls.clear()
+                with self.subTest(row=row, normalizer=name):
+                    with set_attrs(tracks_module, **{name: stub}):
+                        with self.assertRaises(ValueError):
+                            self.tracks.list(validation="strict", **kwargs)
+                        self.tracks.list(validation="warn", **kwargs)
+                    self.assertEqual(len(mocked_paged.calls), 1)
+                    payload = mocked_paged.call_args.args[1]
+                    self.assertEqual(payload.get(key), expected)
 
     def test_list_fields_validation_off_sets_fields(self):
-        with patch.object(
-            self.tracks, "_paged_tracks_json", return_value=[]
-        ) as mocked_paged:
+        mocked_paged = Recorder([])
+        with set_attrs(self.tracks, _paged_tracks_json=mocked_paged):
             self.tracks.list(fields=["id"], validation="off")
-        payload = mocked_paged.call_args[0][1]
+        payload = mocked_paged.call_args.args[1]
         self.assertEqual(payload.get("fields"), ["id"])
 
     def test_list_fields_all_omits_fields(self):
-        with patch.object(
-            self.tracks, "_paged_tracks_json", return_value=[]
-        ) as mocked_paged:
+        mocked_paged = Recorder([])
+        with set_attrs(self.tracks, _paged_tracks_json=mocked_paged):
             self.tracks.list(fields="all", validation="warn")
-        payload = mocked_paged.call_args[0][1]
+        payload = mocked_paged.call_args.args[1]
         self.assertNotIn("fields", payload)
 
-    def test_search_invalid_filter_strict_raises(self):
-        with patch.object(self.tracks, "_request") as mocked_request:
-            with self.assertRaises(ValueError):
-                self.tracks.search(
-                    {"bad": "x"}, sort=[("title", "asc")], validation="strict"
-                )  # type: ignore[arg-type]
-        mocked_request.assert_not_called()
-
-    def test_search_filter_exception_strict(self):
-        with patch(
-            "lexicon.resources.tracks._normalize_filters", side_effect=ValueError("bad")
-        ):
-            with self.assertRaises(ValueError):
-                self.tracks.search(
-                    {"title": "a"}, sort=[("title", "asc")], validation="strict"
-                )
-
-    def test_search_filter_invalid_fields_strict(self):
-        with patch(
-            "lexicon.resources.tracks._normalize_filters",
-            return_value=({}, ["bad"], None),
-        ):
-            with self.assertRaises(ValueError):
-                self.tracks.search(
-                    {"title": "a"}, sort=[("title", "asc")], validation="strict"
-                )
-
-    def test_search_filter_value_errors_strict(self):
-        with patch(
-            "lexicon.resources.tracks._normalize_filters",
-            return_value=({}, None, ["oops"]),
-        ):
-            with self.assertRaises(ValueError):
-                self.tracks.search(
-                    {"title": "a"}, sort=[("title", "asc")], validation="strict"
-                )
-
-    def test_search_invalid_source_strict(self):
-        with self.assertRaises(ValueError):
-            self.tracks.search(
-                {"title": "a"},
-                sort=[("title", "asc")],
-                source="bad",
-                validation="strict",
-            )  # type: ignore[arg-type]
-
-    def test_search_sort_invalid_fields_strict(self):
-        with patch(
-            "lexicon.resources.tracks._normalize_sorts",
-            return_value=([], ["bad"], None),
-        ):
-            with self.assertRaises(ValueError):
-                self.tracks.search(
-                    {"title": "a"}, sort=[("title", "asc")], validation="strict"
-                )
-
-    def test_search_sort_value_errors_strict(self):
-        with patch(
-            "lexicon.resources.tracks._normalize_sorts",
-            return_value=([], None, ["oops"]),
-        ):
+    def test_list_unhashable_sort_direction(self):
+        sort = [("title", ["asc"])]
+        mocked_paged = Recorder([])
+        with set_attrs(self.tracks, _paged_tracks_json=mocked_paged):
             with self.assertRaises(ValueError):
-                self.tracks.search(
-                    {"title": "a"}, sort=[("title", "asc")], validation="strict"
-                )
-
-    def test_search_sort_exception_strict(self):
-        with patch(
-            "lexicon.resources.tracks._normalize_sorts", side_effect=ValueError("bad")
-        ):
+                self.tracks.list(sort=sort, validation="strict")  # type: ignore[arg-type]
+            self.tracks.list(sort=sort, validation="warn")  # type: ignore[arg-type]
+        payload = mocked_paged.call_args.args[1]
+        self.assertEqual(payload["sort"], [{"field": "title", "dir": "asc"}])
+
+    def test_list_unhashable_field(self):
+        mocked_paged = Recorder([])
+        with set_attrs(self.tracks, _paged_tracks_json=mocked_paged):
             with self.assertRaises(ValueError):
-                self.tracks.search(
-                    {"title": "a"}, sort=[("title", "asc")], validation="strict"
-                )
-
-    def test_search_fields_validation_off_sets_fields(self):
-        with patch.object(
-            self.tracks, "_request", return_value={"data": {"tracks": [], "total": 0}}
-        ) as mocked_request:
-            self.tracks.search(
-                {"title": "a"}, sort=[("title", "asc")], fields=["id"], validation="off"
-            )
-        payload = mocked_request.call_args.kwargs["json"]
-        self.assertEqual(payload.get("fields"), ["id"])
-
-    def test_search_fields_all_omits_fields(self):
-        with patch.object(
-            self.tracks, "_request", return_value={"data": {"tracks": [], "total": 0}}
-        ) as mocked_request:
-            self.tracks.search(
-                {"title": "a"}, sort=[("title", "asc")], fields="all", validation="warn"
-            )
-        payload = mocked_request.call_args.kwargs["json"]
-        self.assertNotIn("fields", payload)
-
-    def test_search_fields_invalid_string_strict(self):
-        with patch(
-            "lexicon.resources.tracks._normalize_fields",
-            return_value=(["id"], "bad", None),
-        ):
+                self.tracks.list(fields=[["id"]], validation="strict")  # type: ignore[list-item]
+            self.tracks.list(fields=[["id"]], validation="warn")  # type: ignore[list-item]
+        payload = mocked_paged.call_args.args[1]
+        self.assertEqual(payload["fields"], [])
+
+    def test_update_unhashable_cuepoint_type(self):
+        edits = {"cuepoints": [{"position": 1, "startTime": 1.0, "type": [1]}]}
+        mocked_patch = Recorder()
+        with set_attrs(self.tracks, _patch=mocked_patch):
             with self.assertRaises(ValueError):
-                self.tracks.search(
-                    {"title": "a"}, sort=[("title", "asc")], validation="strict"
-                )
-
-    def test_search_fields_invalid_names_strict(self):
-        with patch(
-            "lexicon.resources.tracks._normalize_fields",
-            return_value=(["id"], None, ["bad"]),
-        ):
-            with self.assertRaises(ValueError):
-                self.tracks.search(
-                    {"title": "a"}, sort=[("title", "asc")], validation="strict"
-                )
-
-    def test_search_filter_exception_warn(self):
-        with (
-            patch(
-                "lexicon.resources.tracks._normalize_filters",
-                side_effect=ValueError("bad"),
-            ),
-            patch.object(self.tracks, "_request") as mocked_request,
-        ):
-            result = self.tracks.search(
-                {"title": "a"}, sort=[("title", "asc")], validation="warn"
-            )
-        self.assertIsNone(result)
-        mocked_request.assert_not_called()
-
-    def test_search_filter_invalid_fields_warn(self):
-        with (
-            patch(
-                "lexicon.resources.tracks._normalize_filters",
-                return_value=({"title": "a"}, ["bad"], None),
-            ),
-            patch.object(
-                self.tracks,
-                "_request",
-                return_value={"data": {"tracks": [], "total": 0}},
-            ) as mocked_request,
-        ):
-            self.tracks.search(
-                {"title": "a"}, sort=[("title", "asc")], validation="warn"
-            )
-        payload = mocked_request.call_args.kwargs["json"]
-        self.assertEqual(payload.get("filter"), {"title": "a"})
-
-    def test_search_filter_value_errors_warn(self):
-        with (
-            patch(
-                "lexicon.resources.tracks._normalize_filters",
-                return_value=({"title": "a"}, None, ["oops"]),
-            ),
-            patch.object(
-                self.tracks,
-                "_request",
-                return_value={"data": {"tracks": [], "total": 0}},
-            ) as mocked_request,
-        ):
-            self.tracks.search(
-                {"title": "a"}, sort=[("title", "asc")], validation="warn"
-            )
-        payload = mocked_request.call_args.kwargs["json"]
-        self.assertEqual(payload.get("filter"), {"title": "a"})
-
-    def test_search_invalid_source_warn(self):
-        with patch.object(
-            self.tracks, "_request", return_value={"data": {"tracks": [], "total": 0}}
-        ) as mocked_request:
-            self.tracks.search(
-                {"title": "a"}, sort=[("title", "asc")], source="bad", validation="warn"
-            )  # type: ignore[arg-type]
-        payload = mocked_request.call_args.kwargs["json"]
-        self.assertNotIn("source", payload)
-
-    def test_search_invalid_source_off(self):
-        with patch.object(
-            self.tracks, "_request", return_value={"data": {"tracks": [], "total": 0}}
-        ) as mocked_request:
-            self.tracks.search(
-                {"title": "a"}, sort=[("title", "asc")], source="bad", validation="off"
-            )  # type: ignore[arg-type]
-        payload = mocked_request.call_args.kwargs["json"]
-        self.assertEqual(payload.get("source"), "bad")
-
-    def test_search_source_none_skips_source(self):
-        with patch.object(
-            self.tracks, "_request", return_value={"data": {"tracks": [], "total": 0}}
-        ) as mocked_request:
-            self.tracks.search(
-                {"title": "a"}, sort=[("title", "asc")], source=None, validation="warn"
-            )
-        payload = mocked_request.call_args.kwargs["json"]
-        self.assertNotIn("source", payload)
-
-    def test_search_empty_sort_skips_sort(self):
-        with patch.object(
-            self.tracks, "_request", return_value={"data": {"tracks": [], "total": 0}}
-        ) as mocked_request:
-            self.tracks.search({"title": "a"}, sort=[], validation="warn")
-        payload = mocked_request.call_args.kwargs["json"]
-        self.assertNotIn("sort", payload)
-
-    def test_search_sort_invalid_fields_warn(self):
-        with (
-            patch(
-                "lexicon.resources.tracks._normalize_sorts",
-                return_value=([], ["bad"], None),
-            ),
-            patch.object(
-                self.tracks,
-                "_request",
-                return_value={"data": {"tracks": [], "total": 0}},
-            ),
-        ):
-            self.tracks.search(
-                {"title": "a"}, sort=[("title", "asc")], validation="warn"
-            )
-
-    def test_search_sort_value_errors_warn(self):
-        with (
-            patch(
-                "lexicon.resources.tracks._normalize_sorts",
-                return_value=([], None, ["oops"]),
-            ),
-            patch.object(
-                self.tracks,
-                "_request",
-                return_value={"data": {"tracks": [], "total": 0}},
-            ),
-        ):
-            self.tracks.search(
-                {"title": "a"}, sort=[("title", "asc")], validation="warn"
-            )
-
-    def test_search_fields_invalid_names_warn(self):
-        with (
-            patch(
-                "lexicon.resources.tracks._normalize_fields",
-                return_value=(["id"], None, ["bad"]),
-            ),
-            patch.object(
-                self.tracks,
-                "_request",
-                return_value={"data": {"tracks": [], "total": 0}},
-            ) as mocked_request,
-        ):
-            self.tracks.search(
-                {"title": "a"},
-                sort=[("title", "asc")],
-                fields=["id"],
-                validation="warn",
-            )
-        payload = mocked_request.call_args.kwargs["json"]
-        self.assertEqual(payload.get("fields"), ["id"])
-
-    def test_search_sort_exception_warn(self):
-        with (
-            patch(
-                "lexicon.resources.tracks._normalize_sorts",
-                side_effect=ValueError("bad"),
-            ),
-            patch.object(
-                self.tracks,
-                "_request",
-                return_value={"data": {"tracks": [], "total": 0}},
-            ) as mocked_request,
-        ):
-            self.tracks.search(
-                {"title": "a"}, sort=[("title", "asc")], validation="warn"
-            )
-        payload = mocked_request.call_args.kwargs["json"]
-        self.assertNotIn("sort", payload)
-
-    def test_search_fields_invalid_string_warn(self):
-        with (
-            patch(
-                "lexicon.resources.tracks._normalize_fields",
-                return_value=(["id"], "bad", None),
-            ),
-            patch.object(
-                self.tracks,
-                "_request",
-                return_value={"data": {"tracks": [], "total": 0}},
-            ) as mocked_request,
-        ):
-            self.tracks.search(
-                {"title": "a"},
-                sort=[("title", "asc")],
-                fields=["id"],
-                validation="warn",
-            )
-        payload = mocked_request.call_args.kwargs["json"]
-        self.assertEqual(payload.get("fields"), ["id"])
-
-    def test_search_response_not_dict(self):
-        with patch.object(self.tracks, "_request", return_value=[]):
-            self.assertIsNone(
-                self.tracks.search({"title": "a"}, sort=[("title", "asc")])
-            )
-
-    def test_search_response_total_warns(self):
-        response = {"data": {"tracks": [{"id": 1}], "total": 10}}
-        with patch.object(self.tracks, "_request", return_value=response):
-            result = self.tracks.search({"title": "a"}, sort=[("title", "asc")])
-        self.assertEqual(result, [{"id": 1}])
-
-    def test_search_response_missing_tracks(self):
-        with patch.object(self.tracks, "_request", return_value={"data": {}}):
-            self.assertIsNone(
-                self.tracks.search({"title": "a"}, sort=[("title", "asc")])
-            )
-
-    def test_search_validation_off_passes_raw_filter(self):
-        with patch.object(
-            self.tracks, "_request", return_value={"data": {"tracks": [], "total": 0}}
-        ) as mocked_request:
-            raw_filter: Mapping[FilterField, object] = {"title": "a"}
-            raw_sort = [{"field": "title"}]
-            self.tracks.search(raw_filter, sort=raw_sort, validation="off")
-        payload = mocked_request.call_args.kwargs["json"]
-        self.assertEqual(payload.get("filter"), raw_filter)
-        self.assertEqual(payload.get("sort"), raw_sort)
+                self.tracks.update(1, edits, validation="strict")  # type: ignore[arg-type]
+            self.tracks.update(1, edits, validation="warn")  # type: ignore[arg-type]
+        payload = mocked_patch.call_args.kwargs["json"]
+        self.assertEqual(payload["edits"], {"cuepoints": []})
 
     def test_update_invalid_edits_strict_raises(self):
-        with patch.object(self.tracks, "_patch") as mocked_patch:
+        mocked_patch = Recorder()
+        with set_attrs(self.tracks, _patch=mocked_patch):
             with self.assertRaises(ValueError):
                 self.tracks.update(1, {"bad": 1}, validation="strict")  # type: ignore[arg-type]
-        mocked_patch.assert_not_called()
+        self.assertEqual(mocked_patch.calls, [])
 
     def test_update_invalid_track_id_strict(self):
         with self.assertRaises(ValueError):
@@ -654,101 +307,88 @@ class TracksValidationTests(unittest.TestCase):
             self.tracks.update(1, [], validation="strict")  # type: ignore[arg-type]
 
     def test_update_normalize_edits_raises_strict(self):
-        with patch(
-            "lexicon.resources.tracks._normalize_edits", side_effect=ValueError("bad")
-        ):
+        with set_attrs(tracks_module, _normalize_edits=raising(ValueError("bad"))):
             with self.assertRaises(ValueError):
                 self.tracks.update(1, {"title": "x"}, validation="strict")
 
     def test_update_value_errors_strict(self):
-        with patch(
-            "lexicon.resources.tracks._normalize_edits",
-            return_value=({"title": "x"}, None, ["oops"]),
-        ):
+        with stub_methods(tracks_module, _normalize_edits=EDITS_VALUE_ERRORS):
             with self.assertRaises(ValueError):
                 self.tracks.update(1, {"title": "x"}, validation="strict")
 
     def test_update_no_valid_edits_strict(self):
-        with patch(
-            "lexicon.resources.tracks._normalize_edits", return_value=({}, None, None)
-        ):
+        with stub_methods(tracks_module, _normalize_edits=EDITS_EMPTY):
             with self.assertRaises(ValueError):
                 self.tracks.update(1, {"title": "x"}, validation="strict")
 
     def test_update_invalid_track_id_warn(self):
-        with patch.object(self.tracks, "_patch") as mocked_patch:
+        mocked_patch = Recorder()
+        with set_attrs(self.tracks, _patch=mocked_patch):
             result = self.tracks.update(0, {"title": "x"}, validation="warn")
         self.assertFalse(result)
-        mocked_patch.assert_not_called()
+        self.assertEqual(mocked_patch.calls, [])
 
     def test_update_invalid_edits_payload_warn(self):
-        with patch.object(self.tracks, "_patch") as mocked_patch:
+        mocked_patch = Recorder()
+        with set_attrs(self.tracks, _patch=mocked_patch):
             result = self.tracks.update(1, [], validation="warn")  # type: ignore[arg-type]
         self.assertFalse(result)
-        mocked_patch.assert_not_called()
+        self.assertEqual(mocked_patch.calls, [])
 
     def test_update_invalid_edits_warn_returns_false(self):
-        with patch.object(self.tracks, "_patch") as mocked_patch:
+        mocked_patch = Recorder()
+        with set_attrs(self.tracks, _patch=mocked_patch):
             result = self.tracks.update(1, {"bad": 1}, validation="warn")  # type: ignore[arg-type]
         self.assertFalse(result)
-        mocked_patch.assert_not_called()
+        self.assertEqual(mocked_patch.calls, [])
 
     def test_update_validation_off(self):
         patch_response = {"data": {"id": 1}}
         get_response = {"id": 1, "title": "x"}
+        mocked_patch = Recorder(patch_response)
         with (
-            patch.object(
-                self.tracks, "_patch", return_value=patch_response
-            ) as mocked_patch,
-            patch.object(self.tracks, "get", return_value=get_response),
+            set_attrs(self.tracks, _patch=mocked_patch),
+            stub_methods(self.tracks, get=get_response),
         ):
             result = self.tracks.update(1, {"title": "x"}, validation="off")
         self.assertEqual(result, {"id": 1, "title": "x"})
-        mocked_patch.assert_called()
+        self.assertTrue(mocked_patch.calls)
 
     def test_update_normalize_edits_raises_warn(self):
+        mocked_patch = Recorder()
         with (
-            patch(
-                "lexicon.resources.tracks._normalize_edits",
-                side_effect=ValueError("bad"),
-            ),
-            patch.object(self.tracks, "_patch") as mocked_patch,
+            set_attrs(tracks_module, _normalize_edits=raising(ValueError("bad"))),
+            set_attrs(self.tracks, _patch=mocked_patch),
         ):
             result = self.tracks.update(1, {"title": "x"}, validation="warn")
         self.assertFalse(result)
-        mocked_patch.assert_not_called()
+        self.assertEqual(mocked_patch.calls, [])
 
     def test_update_value_errors_warn(self):
         patch_response = {"data": {"id": 1}}
         get_response = {"id": 1, "title": "x"}
+        mocked_patch = Recorder(patch_response)
         with (
-            patch(
-                "lexicon.resources.tracks._normalize_edits",
-                return_value=({"title": "x"}, None, ["oops"]),
-            ),
-            patch.object(
-                self.tracks, "_patch", return_value=patch_response
-            ) as mocked_patch,
-            patch.object(self.tracks, "get", return_value=get_response),
+            stub_methods(tracks_module, _normalize_edits=EDITS_VALUE_ERRORS),
+            set_attrs(self.tracks, _patch=mocked_patch),
+            stub_methods(self.tracks, get=get_response),
         ):
             result = self.tracks.update(1, {"title": "x"}, validation="warn")
         self.assertEqual(result, {"id": 1, "title": "x"})
-        mocked_patch.assert_called()
+        self.assertTrue(mocked_patch.calls)
 
     def test_update_response_not_dict(self):
-        with patch.object(self.tracks, "_patch", return_value=[]):
+        with stub_methods(self.tracks, _patch=[]):
             result = self.tracks.update(1, {"title": "x"}, validation="off")
         self.assertIsNone(result)
 
     def test_update_response_missing_track(self):
-        with patch.object(self.tracks, "_patch", return_value={"data": {}}):
+        with stub_methods(self.tracks, _patch={"data": {}}):
             result = self.tracks.update(1, {"title": "x"}, validation="off")
         self.assertIsNone(result)
 
     def test_update_no_valid_edits_warn(self):
-        with patch(
-            "lexicon.resources.tracks._normalize_edits", return_value=({}, None, None)
-        ):
+        with stub_methods(tracks_module, _normalize_edits=EDITS_EMPTY):
             result = self.tracks.update(1, {"title": "x"}, validation="warn")
         self.assertFalse(result)
 
@@ -773,8 +413,8 @@ class TracksValidationTests(unittest.TestCase):
             return {"id": track_id}
 
         with (
-            patch.object(self.tracks, "get", return_value=old),
-            patch.object(self.tracks, "update", side_effect=fake_update),
+            stub_methods(self.tracks, get=old),
+            set_attrs(self.tracks, update=fake_update),
         ):
             result = self.tracks.update_tempogrid(1, [{"startTime": 0.0, "bpm": 120.0}])
         self.assertEqual(result, {"id": 1})
@@ -804,8 +444,8 @@ class TracksValidationTests(unittest.TestCase):
             return {"id": track_id}
 
         with (
-            patch.object(self.tracks, "get", return_value=old),
-            patch.object(self.tracks, "update", side_effect=fake_update),
+            stub_methods(self.tracks, get=old),
+            set_attrs(self.tracks, update=fake_update),
         ):
             self.tracks.update_tempogrid(1, [{"startTime": 0.0, "bpm": 120.0}])
         cps = captured_edits["cuepoints"]
@@ -824,8 +464,8 @@ class TracksValidationTests(unittest.TestCase):
             return {"id": track_id}
 
         with (
-            patch.object(self.tracks, "get", return_value=old),
-            patch.object(self.tracks, "update", side_effect=fake_update),
+            stub_methods(self.tracks, get=old),
+            set_attrs(self.tracks, update=fake_update),
         ):
             self.tracks.update_tempogrid(1, [{"startTime": 0.0, "bpm": 120.0}])
         self.assertNotIn("cuepoints", captured_edits)
@@ -834,295 +474,473 @@ class TracksValidationTests(unittest.TestCase):
         )
 
     def test_update_tempogrid_returns_none_when_get_fails(self):
-        with patch.object(self.tracks, "get", return_value=None):
+        with stub_methods(self.tracks, get=None):
             result = self.tracks.update_tempogrid(1, [{"startTime": 0.0, "bpm": 120.0}])
         self.assertIsNone(result)
 
     def test_add_invalid_locations_strict_raises(self):
-        with patch.object(self.tracks, "_post") as mocked_post:
+        mocked_post = Recorder()
+        with set_attrs(self.tracks, _post=mocked_post):
             with self.assertRaises(ValueError):
                 self.tracks.add("file.mp3", validation="strict")
-        mocked_post.assert_not_called()
+        self.assertEqual(mocked_post.calls, [])
 
     def test_add_invalid_locations_warn(self):
-        with patch.object(self.tracks, "_post") as mocked_post:
+        mocked_post = Recorder()
+        with set_attrs(self.tracks, _post=mocked_post):
             result = self.tracks.add("file.mp3", validation="warn")
         self.assertIsNone(result)
-        mocked_post.assert_not_called()
+        self.assertEqual(mocked_post.calls, [])
 
     def test_add_invalid_locations_off_passes_through(self):
         response = {"data": {"tracks": []}}
-        with patch.object(self.tracks, "_post", return_value=response) as mocked_post:
+        mocked_post = Recorder(response)
+        with set_attrs(self.tracks, _post=mocked_post):
             result = self.tracks.add("ab", validation="off")  # type: ignore[arg-type]
         self.assertEqual(result, [])
-        payload = mocked_post.call_args.kwargs.get("json")
+        payload = mocked_post.call_args.kwargs["json"]
         self.assertEqual(payload.get("locations"), ["a", "b"])
 
     def test_add_invalid_location_list_warn(self):
-        with patch.object(self.tracks, "_post") as mocked_post:
+        mocked_post = Recorder()
+        with set_attrs(self.tracks, _post=mocked_post):
             result = self.tracks.add(["", 123], validation="warn")  # type: ignore[list-item]
         self.assertIsNone(result)
-        mocked_post.assert_not_called()
+        self.assertEqual(mocked_post.calls, [])
 
     def test_add_invalid_location_list_strict(self):
-        with patch.object(self.tracks, "_post") as mocked_post:
+        mocked_post = Recorder()
+        with set_attrs(self.tracks, _post=mocked_post):
             with self.assertRaises(ValueError):
                 self.tracks.add(["", 123], validation="strict")  # type: ignore[list-item]
-        mocked_post.assert_not_called()
+        self.assertEqual(mocked_post.calls, [])
 
     def test_add_response_not_dict(self):
-        with patch.object(self.tracks, "_post", return_value=[]):
+        with stub_methods(self.tracks, _post=[]):
             result = self.tracks.add(["/tmp/a.mp3"], validation="warn")
         self.assertIsNone(result)
 
     def test_add_response_tracks_list(self):
         response = {"data": {"tracks": [{"id": 1}, {"id": 2}]}}
-        with patch.object(self.tracks, "_post", return_value=response):
+        with stub_methods(self.tracks, _post=response):
             result = self.tracks.add(["/tmp/a.mp3"], validation="warn")
         self.assertEqual(result, [{"id": 1}, {"id": 2}])
 
     def test_add_response_tracks_dict(self):
         response = {"data": {"tracks": {"id": 1}}}
-        with patch.object(self.tracks, "_post", return_value=response):
+        with stub_methods(self.tracks, _post=response):
             result = self.tracks.add(["/tmp/a.mp3"], validation="warn")
         self.assertEqual(result, [{"id": 1}])
 
     def test_add_response_missing_tracks(self):
         response = {"data": {}}
-        with patch.object(self.tracks, "_post", return_value=response):
+        with stub_methods(self.tracks, _post=response):
             result = self.tracks.add(["/tmp/a.mp3"], validation="warn")
         self.assertIsNone(result)
 
+    def test_add_batches_large_input(self):
+        responses = [
+            {"data": {"tracks": [{"id": 1}, {"id": 2}]}},
+            {"data": {"tracks": {"id": 3}}},
+        ]
+        mocked_post = Recorder(returns=responses)
+        with set_attrs(self.tracks, _ADD_BATCH_SIZE=2, _post=mocked_post):
+            result = self.tracks.add(["/a.mp3", "/b.mp3", "/c.mp3"])
+        self.assertEqual(result, [{"id": 1}, {"id": 2}, {"id": 3}])
+        batches = [c.kwargs["json"]["locations"] for c in mocked_post.calls]
+        self.assertEqual(batches, [["/a.mp3", "/b.mp3"], ["/c.mp3"]])
+
+    def test_add_later_batch_failure_returns_earlier_tracks(self):
+        responses = [{"data": {"tracks": [{"id": 1}]}}, None]
+        mocked_post = Recorder(returns=responses)
+        with set_attrs(self.tracks, _ADD_BATCH_SIZE=1, _post=mocked_post):
+            with self.assertLogs("lexicon", level="WARNING"):
+                result = self.tracks.add(["/a.mp3", "/b.mp3", "/c.mp3"])
+        self.assertEqual(result, [{"id": 1}])
+        self.assertEqual(len(mocked_post.calls), 2)
+
+    def test_add_first_batch_failure_returns_none(self):
+        mocked_post = Recorder(returns=[None])
+        with set_attrs(self.tracks, _ADD_BATCH_SIZE=1, _post=mocked_post):
+            self.assertIsNone(self.tracks.add(["/a.mp3", "/b.mp3"]))
+        self.assertEqual(len(mocked_post.calls), 1)
+
+    def test_add_empty_list_off_passes_through(self):
+        mocked_post = Recorder({"data": {"tracks": []}})
+        with set_attrs(self.tracks, _post=mocked_post):
+            result = self.tracks.add([], validation="off")
+        self.assertEqual(result, [])
+        self.assertEqual(mocked_post.call_args.kwargs["json"], {"locations": []})
+
     def test_add_tags_appends(self):
         track = {"id": 1, "tags": [10, 20]}
         updated = {"id": 1, "tags": [10, 20, 30]}
+        mocked_update = Recorder(updated)
         with (
-            patch.object(self.tracks, "get", return_value=track),
-            patch.object(self.tracks, "update", return_value=updated) as mocked_update,
+            stub_methods(self.tracks, get=track),
+            set_attrs(self.tracks, update=mocked_update),
         ):
             result = self.tracks.add_tags(1, 30)
         self.assertEqual(result, updated)
-        edits = mocked_update.call_args.kwargs.get("edits") or mocked_update.call_args[
-            1
-        ].get("edits")
+        edits = mocked_update.call_args.kwargs["edits"]
         self.assertEqual(edits["tags"], [10, 20, 30])
 
     def test_add_tags_deduplicates(self):
         track = {"id": 1, "tags": [10, 20]}
         updated = {"id": 1, "tags": [10, 20]}
+        mocked_update = Recorder(updated)
         with (
-            patch.object(self.tracks, "get", return_value=track),
-            patch.object(self.tracks, "update", return_value=updated) as mocked_update,
+            stub_methods(self.tracks, get=track),
+            set_attrs(self.tracks, update=mocked_update),
         ):
             self.tracks.add_tags(1, [20, 10])
-        edits = mocked_update.call_args.kwargs.get("edits") or mocked_update.call_args[
-            1
-        ].get("edits")
+        edits = mocked_update.call_args.kwargs["edits"]
         self.assertEqual(edits["tags"], [10, 20])
 
     def test_add_tags_to_untagged_track(self):
         track = {"id": 1}
         updated = {"id": 1, "tags": [10]}
+        mocked_update = Recorder(updated)
         with (
-            patch.object(self.tracks, "get", return_value=track),
-            patch.object(self.tracks, "update", return_value=updated) as mocked_update,
+            stub_methods(self.tracks, get=track),
+            set_attrs(self.tracks, update=mocked_update),
         ):
             self.tracks.add_tags(1, 10)
-        edits = mocked_update.call_args.kwargs.get("edits") or mocked_update.call_args[
-            1
-        ].get("edits")
+        edits = mocked_update.call_args.kwargs["edits"]
         self.assertEqual(edits["tags"], [10])
 
     def test_add_tags_get_fails(self):
-        with patch.object(self.tracks, "get", return_value=None):
+        with stub_methods(self.tracks, get=None):
             result = self.tracks.add_tags(1, 10)
         self.assertIsNone(result)
 
     def test_add_tags_multiple(self):
         track = {"id": 1, "tags": [10]}
         updated = {"id": 1, "tags": [10, 20, 30]}
+        mocked_update = Recorder(updated)
         with (
-            patch.object(self.tracks, "get", return_value=track),
-            patch.object(self.tracks, "update", return_value=updated) as mocked_update,
+            stub_methods(self.tracks, get=track),
+            set_attrs(self.tracks, update=mocked_update),
         ):
             self.tracks.add_tags(1, [20, 30])
-        edits = mocked_update.call_args.kwargs.get("edits") or mocked_update.call_args[
-            1
-        ].get("edits")
+        edits = mocked_update.call_args.kwargs["edits"]
         self.assertEqual(edits["tags"], [10, 20, 30])
 
     def test_remove_tags_single(self):
         track = {"id": 1, "tags": [10, 20, 30]}
         updated = {"id": 1, "tags": [10, 30]}
+        mocked_update = Recorder(updated)
         with (
-            patch.object(self.tracks, "get", return_value=track),
-            patch.object(self.tracks, "update", return_value=updated) as mocked_update,
+            stub_methods(self.tracks, get=track),
+            set_attrs(self.tracks, update=mocked_update),
         ):
             self.tracks.remove_tags(1, 20)
-        edits = mocked_update.call_args.kwargs.get("edits") or mocked_update.call_args[
-            1
-        ].get("edits")
+        edits = mocked_update.call_args.kwargs["edits"]
         self.assertEqual(edits["tags"], [10, 30])
 
     def test_remove_tags_multiple(self):
         track = {"id": 1, "tags": [10, 20, 30]}
         updated = {"id": 1, "tags": [10]}
+        mocked_update = Recorder(updated)
         with (
-            patch.object(self.tracks, "get", return_value=track),
-            patch.object(self.tracks, "update", return_value=updated) as mocked_update,
+            stub_methods(self.tracks, get=track),
+            set_attrs(self.tracks, update=mocked_update),
         ):
             self.tracks.remove_tags(1, [20, 30])
-        edits = mocked_update.call_args.kwargs.get("edits") or mocked_update.call_args[
-            1
-        ].get("edits")
+        edits = mocked_update.call_args.kwargs["edits"]
         self.assertEqual(edits["tags"], [10])
 
     def test_remove_tags_get_fails(self):
-        with patch.object(self.tracks, "get", return_value=None):
+        with stub_methods(self.tracks, get=None):
             result = self.tracks.remove_tags(1, 10)
         self.assertIsNone(result)
 
     def test_remove_tags_all(self):
         track = {"id": 1, "tags": [10]}
         updated = {"id": 1, "tags": []}
+        mocked_update = Recorder(updated)
         with (
-            patch.object(self.tracks, "get", return_value=track),
-            patch.object(self.tracks, "update", return_value=updated) as mocked_update,
+            stub_methods(self.tracks, get=track),
+            set_attrs(self.tracks, update=mocked_update),
         ):
             self.tracks.remove_tags(1, 10)
-        edits = mocked_update.call_args.kwargs.get("edits") or mocked_update.call_args[
-            1
-        ].get("edits")
+        edits = mocked_update.call_args.kwargs["edits"]
         self.assertEqual(edits["tags"], [])
 
     def test_delete_invalid_track_ids_strict_raises(self):
-        with patch.object(self.tracks, "_delete") as mocked_delete:
+        mocked_delete = Recorder()
+        with set_attrs(self.tracks, _delete=mocked_delete):
             with self.assertRaises(ValueError):
                 self.tracks.delete("nope", validation="strict")  # type: ignore[arg-type]
-        mocked_delete.assert_not_called()
+        self.assertEqual(mocked_delete.calls, [])
 
     def test_delete_invalid_track_ids_warn_returns_false(self):
-        with patch.object(self.tracks, "_delete") as mocked_delete:
+        mocked_delete = Recorder()
+        with set_attrs(self.tracks, _delete=mocked_delete):
             result = self.tracks.delete("nope", validation="warn")  # type: ignore[arg-type]
         self.assertFalse(result)
-        mocked_delete.assert_not_called()
+        self.assertEqual(mocked_delete.calls, [])
 
     def test_delete_all_invalid_ids_warn(self):
-        with patch.object(self.tracks, "_delete") as mocked_delete:
+        mocked_delete = Recorder()
+        with set_attrs(self.tracks, _delete=mocked_delete):
             result = self.tracks.delete([0, -1], validation="warn")
         self.assertFalse(result)
-        mocked_delete.assert_not_called()
+        self.assertEqual(mocked_delete.calls, [])
 
     def test_delete_int_ids(self):
-        with patch.object(self.tracks, "_delete", return_value={}) as mocked_delete:
+        mocked_delete = Recorder({})
+        with set_attrs(self.tracks, _delete=mocked_delete):
             result = self.tracks.delete(1, validation="warn")
         self.assertTrue(result)
-        mocked_delete.assert_called()
+        self.assertTrue(mocked_delete.calls)
 
     def test_delete_sequence_ids(self):
-        with patch.object(self.tracks, "_delete", return_value={}) as mocked_delete:
+        mocked_delete = Recorder({})
+        with set_attrs(self.tracks, _delete=mocked_delete):
             result = self.tracks.delete([1, 2], validation="warn")
         self.assertTrue(result)
-        mocked_delete.assert_called()
+        self.assertTrue(mocked_delete.calls)
+
+    def test_delete_batches_large_input(self):
+        mocked_delete = Recorder({})
+        with set_attrs(self.tracks, _DELETE_BATCH_SIZE=2, _delete=mocked_delete):
+            result = self.tracks.delete([1, 2, 3, 4, 5], validation="warn")
+        self.assertTrue(result)
+        batches = [c.kwargs["json"]["ids"] for c in mocked_delete.calls]
+        self.assertEqual(batches, [[1, 2], [3, 4], [5]])
+
+    def test_delete_batch_failure_returns_false(self):
+        mocked_delete = Recorder(returns=[{}, None, {}])
+        with set_attrs(self.tracks, _DELETE_BATCH_SIZE=2, _delete=mocked_delete):
+            result = self.tracks.delete([1, 2, 3, 4, 5], validation="warn")
+        self.assertFalse(result)
+        self.assertEqual(len(mocked_delete.calls), 3)
 
     def test_delete_invalid_ids_off(self):
-        with patch.object(self.tracks, "_delete", return_value={}) as mocked_delete:
+        mocked_delete = Recorder({})
+        with set_attrs(self.tracks, _delete=mocked_delete):
             result = self.tracks.delete("nope", validation="off")  # type: ignore[arg-type]
         self.assertTrue(result)
-        mocked_delete.assert_called()
+        self.assertTrue(mocked_delete.calls)
 
     def test_delete_all_invalid_ids_strict(self):
         with self.assertRaises(ValueError):
             self.tracks.delete([0, -1], validation="strict")
 
-    def test_paged_tracks_limit_zero(self):
-        with patch.object(self.tracks, "_request") as mocked_request:
-            result = self.tracks._paged_tracks_json(
-                "/tracks", {}, limit=0, offset=0, timeout=None
+
+class TracksPagingTests(DummyClientTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.tracks = Tracks(cls.client)  # type: ignore[arg-type]
+
+    def _paged(self, *responses, limit=None):
+        # One response per _request call; running past them raises StopIteration.
+        self.mocked_request = Recorder(returns=responses)
+        with set_attrs(self.tracks, _request=self.mocked_request):
+            return self.tracks._paged_tracks_json(
+                "/tracks", {}, limit=limit, offset=0, timeout=None
             )
-        self.assertEqual(result, [])
-        mocked_request.assert_not_called()
+
+    def test_paged_tracks_limit_zero(self):
+        self.assertEqual(self._paged(limit=0), [])
+        self.assertEqual(self.mocked_request.calls, [])
 
     def test_paged_tracks_response_not_dict(self):
-        with patch.object(self.tracks, "_request", return_value=[]):
-            result = self.tracks._paged_tracks_json(
-                "/tracks", {}, limit=10, offset=0, timeout=None
-            )
-        self.assertIsNone(result)
+        self.assertIsNone(self._paged([], limit=10))
 
     def test_paged_tracks_missing_tracks_list(self):
-        response = {"data": {"tracks": "nope"}}
-        with patch.object(self.tracks, "_request", return_value=response):
-            result = self.tracks._paged_tracks_json(
-                "/tracks", {}, limit=10, offset=0, timeout=None
-            )
-        self.assertIsNone(result)
+        self.assertIsNone(self._paged({"data": {"tracks": "nope"}}, limit=10))
 
     def test_paged_tracks_remaining_breaks(self):
         response = {"data": {"tracks": [{"id": 1}], "total": 1, "limit": 1000}}
-        with patch.object(self.tracks, "_request", return_value=response):
-            result = self.tracks._paged_tracks_json(
-                "/tracks", {}, limit=1, offset=0, timeout=None
-            )
-        self.assertEqual(result, [{"id": 1}])
+        self.assertEqual(self._paged(response, limit=1), [{"id": 1}])
 
     def test_paged_tracks_remaining_continues(self):
-        responses = [
-            {"data": {"tracks": [{"id": 1}, {"id": 2}], "total": 3, "limit": 2}},
-            {"data": {"tracks": [{"id": 3}], "total": 3, "limit": 2}},
-        ]
-        with patch.object(self.tracks, "_request", side_effect=responses):
-            result = self.tracks._paged_tracks_json(
-                "/tracks", {}, limit=3, offset=0, timeout=None
-            )
+        result = self._paged(*TWO_PAGE_RESPONSES, limit=3)
         self.assertEqual(result, [{"id": 1}, {"id": 2}, {"id": 3}])
 
     def test_paged_tracks_total_limit_paging(self):
-        responses = [
-            {"data": {"tracks": [{"id": 1}, {"id": 2}], "total": 3, "limit": 2}},
-            {"data": {"tracks": [{"id": 3}], "total": 3, "limit": 2}},
-        ]
-        with patch.object(self.tracks, "_request", side_effect=responses):
-            result = self.tracks._paged_tracks_json(
-                "/tracks", {}, limit=None, offset=0, timeout=None
-            )
+        result = self._paged(*TWO_PAGE_RESPONSES)
         self.assertEqual(result, [{"id": 1}, {"id": 2}, {"id": 3}])
 
     def test_paged_tracks_short_page_breaks(self):
         response = {"data": {"tracks": [{"id": 1}], "total": 10, "limit": 1000}}
-        with patch.object(self.tracks, "_request", return_value=response):
-            result = self.tracks._paged_tracks_json(
-                "/tracks", {}, limit=None, offset=0, timeout=None
-            )
-        self.assertEqual(result, [{"id": 1}])
+        self.assertEqual(self._paged(response), [{"id": 1}])
 
     def test_paged_tracks_short_page_no_total(self):
         response = {"data": {"tracks": [{"id": 1}]}}
-        with patch.object(self.tracks, "_request", return_value=response):
-            result = self.tracks._paged_tracks_json(
-                "/tracks", {}, limit=None, offset=0, timeout=None
-            )
-        self.assertEqual(result, [{"id": 1}])
+        self.assertEqual(self._paged(response), [{"id": 1}])
 
     def test_paged_tracks_full_page_no_total(self):
-        full_page = [{"id": i} for i in range(1000)]
-        responses = [
-            {"data": {"tracks": full_page}},
-            [],
-        ]
-        with patch.object(self.tracks, "_request", side_effect=responses):
-            result = self.tracks._paged_tracks_json(
-                "/tracks", {}, limit=None, offset=0, timeout=None
-            )
+        self.assertIsNone(self._paged(FULL_PAGE_RESPONSE, []))
+
+
+class TracksSearchTests(DummyClientTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.tracks = Tracks(cls.client)  # type: ignore[arg-type]
+
+    def setUp(self) -> None:
+        super().setUp()
+        # Searches answer with an empty page unless a test installs its own
+        # _request stub on top of this one.
+        self.mocked_request = Recorder(EMPTY_SEARCH_RESPONSE)
+        stub = set_attrs(self.tracks, _request=self.mocked_request)
+        stub.__enter__()
+        self.addCleanup(stub.__exit__, None, None, None)
+
+    def _search(self, filters=SEARCH_FILTER, **kwargs):
+        kwargs.setdefault("sort", SEARCH_SORT)
+        return self.tracks.search(filters, **kwargs)
+
+    def _payload(self):
+        return self.mocked_request.call_args.kwargs["json"]
+
+    def test_search_invalid_filter_strict_raises(self):
+        with self.assertRaises(ValueError):
+            self._search({"bad": "x"}, validation="strict")  # type: ignore[arg-type]
+        self.assertEqual(self.mocked_request.calls, [])
+
+    def test_search_filter_exception_strict(self):
+        with set_attrs(tracks_module, _normalize_filters=raising(ValueError("bad"))):
+            with self.assertRaises(ValueError):
+                self._search(validation="strict")
+
+    def test_search_filter_invalid_fields_strict(self):
+        with stub_methods(tracks_module, _normalize_filters=FILTERS_INVALID_FIELDS):
+            with self.assertRaises(ValueError):
+                self._search(validation="strict")
+
+    def test_search_filter_value_errors_strict(self):
+        with stub_methods(tracks_module, _normalize_filters=FILTERS_VALUE_ERRORS):
+            with self.assertRaises(ValueError):
+                self._search(validation="strict")
+
+    def test_search_invalid_source_strict(self):
+        with self.assertRaises(ValueError):
+            self._search(source="bad", validation="strict")  # type: ignore[arg-type]
+
+    def test_search_sort_invalid_fields_strict(self):
+        with stub_methods(tracks_module, _normalize_sorts=SORTS_INVALID_FIELDS):
+            with self.assertRaises(ValueError):
+                self._search(validation="strict")
+
+    def test_search_sort_value_errors_strict(self):
+        with stub_methods(tracks_module, _normalize_sorts=SORTS_VALUE_ERRORS):
+            with self.assertRaises(ValueError):
+                self._search(validation="strict")
+
+    def test_search_sort_exception_strict(self):
+        with set_attrs(tracks_module, _normalize_sorts=raising(ValueError("bad"))):
+            with self.assertRaises(ValueError):
+                self._search(validation="strict")
+
+    def test_search_fields_validation_off_sets_fields(self):
+        self._search(fields=["id"], validation="off")
+        self.assertEqual(self._payload().get("fields"), ["id"])
+
+    def test_search_fields_all_omits_fields(self):
+        self._search(fields="all", validation="warn")
+        self.assertNotIn("fields", self._payload())
+
+    def test_search_fields_invalid_string_strict(self):
+        with stub_methods(tracks_module, _normalize_fields=FIELDS_INVALID_STRING):
+            with self.assertRaises(ValueError):
+                self._search(validation="strict")
+
+    def test_search_fields_invalid_names_strict(self):
+        with stub_methods(tracks_module, _normalize_fields=FIELDS_INVALID_NAMES):
+            with self.assertRaises(ValueError):
+                self._search(validation="strict")
+
+    def test_search_filter_exception_warn(self):
+        with set_attrs(tracks_module, _normalize_filters=raising(ValueError("bad"))):
+            result = self._search(validation="warn")
         self.assertIsNone(result)
+        self.assertEqual(self.mocked_request.calls, [])
+
+    def test_search_filter_invalid_fields_warn(self):
+        with stub_methods(
+            tracks_module, _normalize_filters=({"title": "a"}, ["bad"], None)
+        ):
+            self._search(validation="warn")
+        self.assertEqual(self._payload().get("filter"), {"title": "a"})
+
+    def test_search_filter_value_errors_warn(self):
+        with stub_methods(
+            tracks_module, _normalize_filters=({"title": "a"}, None, ["oops"])
+        ):
+            self._search(validation="warn")
+        self.assertEqual(self._payload().get("filter"), {"title": "a"})
+
+    def test_search_invalid_source_warn(self):
+        self._search(source="bad", validation="warn")  # type: ignore[arg-type]
+        self.assertNotIn("source", self._payload())
+
+    def test_search_invalid_source_off(self):
+        self._search(source="bad", validation="off")  # type: ignore[arg-type]
+        self.assertEqual(self._payload().get("source"), "bad")
+
+    def test_search_source_none_skips_source(self):
+        self._search(source=None, validation="warn")
+        self.assertNotIn("source", self._payload())
+
+    def test_search_empty_sort_skips_sort(self):
+        self._search(sort=[], validation="warn")
+        self.assertNotIn("sort", self._payload())
+
+    def test_search_sort_invalid_fields_warn(self):
+        with stub_methods(tracks_module, _normalize_sorts=SORTS_INVALID_FIELDS):
+            self._search(validation="warn")
+
+    def test_search_sort_value_errors_warn(self):
+        with stub_methods(tracks_module, _normalize_sorts=SORTS_VALUE_ERRORS):
+            self._search(validation="warn")
+
+    def test_search_fields_invalid_names_warn(self):
+        with stub_methods(tracks_module, _normalize_fields=FIELDS_INVALID_NAMES):
+            self._search(fields=["id"], validation="warn")
+        self.assertEqual(self._payload().get("fields"), ["id"])
+
+    def test_search_sort_exception_warn(self):
+        with set_attrs(tracks_module, _normalize_sorts=raising(ValueError("bad"))):
+            self._search(validation="warn")
+        self.assertNotIn("sort", self._payload())
+
+    def test_search_fields_invalid_string_warn(self):
+        with stub_methods(tracks_module, _normalize_fields=FIELDS_INVALID_STRING):
+            self._search(fields=["id"], validation="warn")
+        self.assertEqual(self._payload().get("fields"), ["id"])
+
+    def test_search_response_not_dict(self):
+        with stub_methods(self.tracks, _request=[]):
+            self.assertIsNone(self._search())
+
+    def test_search_response_total_warns(self):
+        response = {"data": {"tracks": [{"id": 1}], "total": 10}}
+        with stub_methods(self.tracks, _request=response):
+            result = self._search()
+        self.assertEqual(result, [{"id": 1}])
+
+    def test_search_response_missing_tracks(self):
+        with stub_methods(self.tracks, _request={"data": {}}):
+            self.assertIsNone(self._search())
+
+    def test_search_validation_off_passes_raw_filter(self):
+        raw_filter: Mapping[FilterField, object] = {"title": "a"}
+        raw_sort = [{"field": "title"}]
+        self.tracks.search(raw_filter, sort=raw_sort, validation="off")
+        payload = self._payload()
+        self.assertEqual(payload.get("filter"), raw_filter)
+        self.assertEqual(payload.get("sort"), raw_sort)
 
 
 class TracksTypesValidationTests(unittest.TestCase):
     def test_normalize_fields_all(self):
-        fields, input_error, invalid_fields = _normalize_fields("all")
-        self.assertIsNone(fields)
-        self.assertIsNone(input_error)
-        self.assertIsNone(invalid_fields)
+        self.assertEqual(_normalize_fields("all"), (None, None, None))
 
     def test_normalize_fields_invalid_string(self):
         fields, input_error, invalid_fields = _normalize_fields("nope")  # type: ignore[arg-type]
@@ -1143,29 +961,37 @@ class TracksTypesValidationTests(unittest.TestCase):
         self.assertTrue(fields)
 
     def test_normalize_fields_extra_fields(self):
-        fields, input_error, invalid_fields = _normalize_fields(
-            ["id"], extra_fields=["title"]
+        result = _normalize_fields(["id"], extra_fields=["title"])
+        self.assertEqual(result, (["id", "title"], None, None))
+
+    def test_normalize_fields_extra_fields_iterator(self):
+        fields, _, invalid_fields = _normalize_fields(
+            ["id"], extra_fields=iter(["title", "id", "artist"])
         )
-        self.assertIsNone(input_error)
         self.assertIsNone(invalid_fields)
-        self.assertIn("id", fields or [])
-        self.assertIn("title", fields or [])
+        self.assertEqual(fields, ["id", "title", "artist"])
+
+    def test_normalize_fields_dedupes_preserving_order(self):
+        fields, _, invalid_fields = _normalize_fields(
+            ["title", "id", "title", "nope"],  # type: ignore[list-item]
+            extra_fields=["bpm", "id", "nope", "bpm", "key"],  # type: ignore[list-item]
+        )
+        self.assertEqual(fields, ["title", "id", "bpm", "key"])
+        self.assertEqual(invalid_fields, ["nope"])
 
     def test_normalize_filters_invalid_type(self):
         with self.assertRaises(ValueError):
             _normalize_filters(["title"])  # type: ignore[arg-type]
 
     def test_normalize_filters_invalid_field(self):
-        payload, invalid_fields, value_errors = _normalize_filters({"bad": "x"})  # type: ignore[arg-type]
-        self.assertEqual(payload, {})
-        self.assertIn("bad", invalid_fields or [])
-        self.assertIsNone(value_errors)
+        result = _normalize_filters({"bad": "x"})  # type: ignore[arg-type]
+        self.assertEqual(result, ({}, ["bad"], None))
 
     def test_normalize_filters_value_error(self):
         payload, invalid_fields, value_errors = _normalize_filters({"bpm": "abc"})
         self.assertEqual(payload, {})
         self.assertIsNone(invalid_fields)
-        self.assertTrue(any(err.startswith("bpm:") for err in value_errors or []))
+        self.assertIn("bpm", _error_fields(value_errors))
 
     def test_normalize_filters_date_operator_error(self):
         payload, invalid_fields, value_errors = _normalize_filters(
@@ -1173,13 +999,13 @@ class TracksTypesValidationTests(unittest.TestCase):
         )
         self.assertEqual(payload, {})
         self.assertIsNone(invalid_fields)
-        self.assertTrue(any(err.startswith("dateAdded:") for err in value_errors or []))
+        self.assertIn("dateAdded", _error_fields(value_errors))
 
     def test_normalize_filters_tags_error(self):
         payload, invalid_fields, value_errors = _normalize_filters({"tags": None})
         self.assertEqual(payload, {})
         self.assertIsNone(invalid_fields)
-        self.assertTrue(any(err.startswith("tags:") for err in value_errors or []))
+        self.assertIn("tags", _error_fields(value_errors))
 
     def test_normalize_filters_success(self):
         filters: dict[FilterField, object] = {
@@ -1188,13 +1014,13 @@ class TracksTypesValidationTests(unittest.TestCase):
             "dateAdded": "2024-01-01T00:00:00Z",
             "tags": "House",
         }
-        payload, invalid_fields, value_errors = _normalize_filters(filters)
-        self.assertEqual(payload["title"], "Daft")
-        self.assertEqual(payload["bpm"], "120")
-        self.assertEqual(payload["dateAdded"], "2024-01-01")
-        self.assertEqual(payload["tags"], "House")
-        self.assertIsNone(invalid_fields)
-        self.assertIsNone(value_errors)
+        expected_payload = {
+            "title": "Daft",
+            "bpm": "120",
+            "dateAdded": "2024-01-01",
+            "tags": "House",
+        }
+        self.assertEqual(_normalize_filters(filters), (expected_payload, None, None))
 
     def test_normalize_filters_tag_invalid(self):
         payload, invalid_fields, value_errors = _normalize_filters({"tags": "bad,,"})
@@ -1208,10 +1034,8 @@ class TracksTypesValidationTests(unittest.TestCase):
 
     @unittest.skip("Not needed for current missing-coverage targets")
     def test_normalize_edits_invalid_field(self):
-        payload, invalid_fields, value_errors = _normalize_edits({"bad": "x"})  # type: ignore[arg-type]
-        self.assertEqual(payload, {})
-        self.assertIn("bad", invalid_fields or [])
-        self.assertIsNone(value_errors)
+        result = _normalize_edits({"bad": "x"})  # type: ignore[arg-type]
+        self.assertEqual(result, ({}, ["bad"], None))
 
     def test_normalize_edits_success(self):
         edits: dict[TrackEditField, object] = {
@@ -1221,14 +1045,14 @@ class TracksTypesValidationTests(unittest.TestCase):
             "comment": "Updated",
             "tags": [1, 2, 2, 0],
         }
-        payload, invalid_fields, value_errors = _normalize_edits(edits)
-        self.assertEqual(payload["archived"], 1)
-        self.assertEqual(payload["title"], "New")
-        self.assertEqual(payload["rating"], 5)
-        self.assertEqual(payload["comment"], "Updated")
-        self.assertEqual(payload["tags"], [1, 2])
-        self.assertIsNone(invalid_fields)
-        self.assertIsNone(value_errors)
+        expected_payload = {
+            "archived": 1,
+            "title": "New",
+            "rating": 5,
+            "comment": "Updated",
+            "tags": [1, 2],
+        }
+        self.assertEqual(_normalize_edits(edits), (expected_payload, None, None))
 
     def test_normalize_edits_cuepoints_partial_errors(self):
         edits: dict[TrackEditField, object] = {
@@ -1245,21 +1069,21 @@ class TracksTypesValidationTests(unittest.TestCase):
         payload, invalid_fields, value_errors = _normalize_edits(edits)
         self.assertIn("cuepoints", payload)
         self.assertIsNone(invalid_fields)
-        self.assertTrue(any(err.startswith("cuepoints:") for err in value_errors or []))
+        self.assertIn("cuepoints", _error_fields(value_errors))
 
     def test_normalize_edits_cuepoints_fatal(self):
         edits: dict[TrackEditField, object] = {"cuepoints": "bad"}  # type: ignore[assignment]
         payload, invalid_fields, value_errors = _normalize_edits(edits)
         self.assertIn("cuepoints", payload)
         self.assertIsNone(invalid_fields)
-        self.assertTrue(any(err.startswith("cuepoints:") for err in value_errors or []))
+        self.assertIn("cuepoints", _error_fields(value_errors))
 
     def test_normalize_edits_cuepoints_dropped(self):
         edits: dict[TrackEditField, object] = {"cuepoints": [{}]}
         payload, invalid_fields, value_errors = _normalize_edits(edits)
         self.assertIn("cuepoints", payload)
         self.assertIsNone(invalid_fields)
-        self.assertTrue(any(err.startswith("cuepoints:") for err in value_errors or []))
+        self.assertIn("cuepoints", _error_fields(value_errors))
 
     def test_normalize_edits_tempomarkers_duplicate(self):
         edits: dict[TrackEditField, object] = {
@@ -1278,16 +1102,14 @@ class TracksTypesValidationTests(unittest.TestCase):
         payload, invalid_fields, value_errors = _normalize_edits(edits)
         self.assertIn("tempomarkers", payload)
         self.assertIsNone(invalid_fields)
-        self.assertTrue(
-            any(err.startswith("tempomarkers:") for err in value_errors or [])
-        )
+        self.assertIn("tempomarkers", _error_fields(value_errors))
 
     def test_normalize_edits_value_error(self):
         edits: dict[TrackEditField, object] = {"rating": -1}
         payload, invalid_fields, value_errors = _normalize_edits(edits)
         self.assertEqual(payload, {})
         self.assertIsNone(invalid_fields)
-        self.assertTrue(any(err.startswith("rating:") for err in value_errors or []))
+        self.assertIn("rating", _error_fields(value_errors))
 
     def test_normalize_sorts_invalid_type(self):
         with self.assertRaises(ValueError):
@@ -1299,10 +1121,8 @@ class TracksTypesValidationTests(unittest.TestCase):
 
     def test_normalize_sorts_dict(self):
         sort_input: list[dict[str, str]] = [{"field": "title", "dir": "asc"}]
-        payload, invalid_fields, value_errors = _normalize_sorts(sort_input)
-        self.assertEqual(payload, [{"field": "title", "dir": "asc"}])
-        self.assertIsNone(invalid_fields)
-        self.assertIsNone(value_errors)
+        expected = ([{"field": "title", "dir": "asc"}], None, None)
+        self.assertEqual(_normalize_sorts(sort_input), expected)
 
     def test_normalize_sorts_missing_field_key(self):
         payload, invalid_fields, value_errors = _normalize_sorts([{"dir": "asc"}])
@@ -1311,16 +1131,16 @@ class TracksTypesValidationTests(unittest.TestCase):
         self.assertTrue(value_errors)
 
     def test_normalize_sorts_non_tuple_item(self):
-        payload, invalid_fields, value_errors = _normalize_sorts([123])  # type: ignore[list-item]
-        self.assertEqual(payload, [])
-        self.assertIsNone(invalid_fields)
-        self.assertIsNone(value_errors)
+        result = _normalize_sorts([123])  # type: ignore[list-item]
+        self.assertEqual(result, ([], None, None))
 
     def test_normalize_sorts_invalid_field(self):
-        payload, invalid_fields, value_errors = _normalize_sorts([("nope", "asc")])  # type: ignore[arg-type]
-        self.assertEqual(payload, [])
-        self.assertIn("nope", invalid_fields or [])
-        self.assertIsNone(value_errors)
+        result = _normalize_sorts([("nope", "asc")])  # type: ignore[arg-type]
+        self.assertEqual(result, ([], ["nope"], None))
+
+    def test_normalize_sorts_disallowed_field(self):
+        result = _normalize_sorts([("cuepoints", "asc")])  # type: ignore[arg-type]
+        self.assertEqual(result, ([], None, ["Field not sortable: cuepoints"]))
 
     def test_normalize_sorts_invalid_direction(self):
         payload, invalid_fields, value_errors = _normalize_sorts(
@@ -1331,68 +1151,82 @@ class TracksTypesValidationTests(unittest.TestCase):
         self.assertTrue(value_errors)
 
     def test_normalize_sorts_direction_none(self):
-        payload, invalid_fields, value_errors = _normalize_sorts([("title", None)])
-        self.assertEqual(payload, [{"field": "title", "dir": "asc"}])
-        self.assertIsNone(invalid_fields)
-        self.assertIsNone(value_errors)
-
-    def test_normalize_bool_variants(self):
-        self.assertEqual(_normalize_bool(True, context="edit"), 1)
-        self.assertEqual(_normalize_bool(0.0, context="edit"), 0)
-        self.assertEqual(_normalize_bool("yes", context="edit"), 1)
-        self.assertEqual(_normalize_bool("no", context="edit"), 0)
-        with self.assertRaises(ValueError):
-            _normalize_bool("maybe", context="edit")
-        with self.assertRaises(ValueError):
-            _normalize_bool(2, context="edit")
+        expected = ([{"field": "title", "dir": "asc"}], None, None)
+        self.assertEqual(_normalize_sorts([("title", None)]), expected)
 
-    def test_normalize_text_variants(self):
-        self.assertEqual(_normalize_text(None, context="filter"), "NONE")
-        self.assertIsNone(_normalize_text(None, context="edit"))
-        self.assertEqual(_normalize_text("hi", context="edit"), "hi")
-        with self.assertRaises(ValueError):
-            _normalize_text(1, context="edit")
-
-    def test_normalize_number_variants(self):
-        self.assertEqual(_normalize_number(None, context="filter"), "0")
-        self.assertEqual(_normalize_number("none", context="filter"), "0")
-        self.assertEqual(_normalize_number("1 - 2", context="filter"), "1-2")
-        self.assertEqual(_normalize_number("<=2", context="filter"), "<=2")
-        self.assertEqual(_normalize_number("+1.5", context="edit"), "+1.5")
-        with self.assertRaises(ValueError):
-            _normalize_number(-1, context="filter")
-        with self.assertRaises(ValueError):
-            _normalize_number("bad", context="filter")
-        with self.assertRaises(ValueError):
-            _normalize_number("bad", context="edit")
-        with self.assertRaises(ValueError):
-            _normalize_number("1", context="other")  # type: ignore[arg-type]
-        with self.assertRaises(ValueError):
-            _normalize_number({}, context="filter")  # type: ignore[arg-type]
-
-    def test_normalize_date_variants(self):
-        self.assertEqual(_normalize_date(None, context="filter"), "NONE")
-        self.assertIsNone(_normalize_date("none", context="edit"))
-        self.assertEqual(
-            _normalize_date("2024-01-01T12:00:00Z", context="filter"), "2024-01-01"
+    def test_normalize_sorts_dedupes_entries(self):
+        payload, _, _ = _normalize_sorts(
+            [("title", None), {"field": "title", "dir": "asc"}, ("bpm", "desc")]
         )
-        self.assertEqual(_normalize_date("2024-01-01", context="edit"), "2024-01-01")
         self.assertEqual(
-            _normalize_date(datetime(2024, 1, 2, 3, 4), context="edit"), "2024-01-02"
+            payload,
+            [{"field": "title", "dir": "asc"}, {"field": "bpm", "dir": "desc"}],
         )
-        self.assertEqual(
-            _normalize_date(date(2024, 1, 3), context="edit"), "2024-01-03"
-        )
-        with self.assertRaises(ValueError):
-            _normalize_date("01-01-2024", context="filter")
-        with self.assertRaises(ValueError):
-            _normalize_date(">2024-01-01", context="filter")
-        with self.assertRaises(ValueError):
-            _normalize_date("01-01-2024", context="edit")
-        with self.assertRaises(ValueError):
-            _normalize_date("2024-01-01", context="other")  # type: ignore[arg-type]
-        with self.assertRaises(ValueError):
-            _normalize_date(123, context="edit")  # type: ignore[arg-type]
+
+    # (normalizer, value, expected)
+    SCALAR_NORMALIZER_CASES = [
+        (_normalize_bool_value, True, 1),
+        (_normalize_bool_value, 0.0, 0),
+        (_normalize_bool_value, "yes", 1),
+        (_normalize_bool_value, "no", 0),
+        (_normalize_text_filter, None, "NONE"),
+        (_normalize_text_edit, None, None),
+        (_normalize_text_edit, "hi", "hi"),
+        (_normalize_number_filter, None, "0"),
+        (_normalize_number_filter, "none", "0"),
+        (_normalize_number_filter, "1 - 2", "1-2"),
+        (_normalize_number_filter, "<=2", "<=2"),
+        (_normalize_number_edit, "+1.5", "+1.5"),
+        (_normalize_date_filter, None, "NONE"),
+        (_normalize_date_edit, "none", None),
+        (_normalize_date_filter, "2024-01-01T12:00:00Z", "2024-01-01"),
+        (_normalize_date_edit, "2024-01-01", "2024-01-01"),
+        (_normalize_date_edit, "2024-01-01T12:00:00Z", "2024-01-01"),
+        (_normalize_date_edit, datetime(2024, 1, 2, 3, 4), "2024-01-02"),
+        (_normalize_date_edit, date(2024, 1, 3), "2024-01-03"),
+    ]
+    # (normalizer, value) rows that raise ValueError
+    SCALAR_NORMALIZER_ERRORS = [
+        (_normalize_bool_value, "maybe"),
+        (_normalize_bool_value, 2),
+        (_normalize_text_edit, 1),
+        (_normalize_number_filter, -1),
+        (_normalize_number_filter, "bad"),
+        (_normalize_number_edit, "bad"),
+        (_normalize_number_filter, {}),
+        (_normalize_date_filter, "01-01-2024"),
+        (_normalize_date_filter, ">2024-01-01"),
+        (_normalize_date_edit, "01-01-2024"),
+        (_normalize_date_edit, "2024-1-01"),
+        (_normalize_date_edit, 123),
+    ]
+
+    def test_scalar_normalizer_variants(self):
+        for normalizer, value, expected in self.SCALAR_NORMALIZER_CASES:
+            with self.subTest(normalizer.__name__, value=value):
+                self.assertEqual(normalizer(value), expected)
+
+    def test_scalar_normalizer_errors(self):
+        for normalizer, value in self.SCALAR_NORMALIZER_ERRORS:
+            with self.subTest(normalizer.__name__, value=value):
+                with self.assertRaises(ValueError):
+                    normalizer(value)
+
+    def test_normalize_number_repeated_inputs(self):
+        # String parses are memoized; repeats must still raise and keep types
+        for _ in range(2):
+            self.assertEqual(_normalize_number_filter("1 - 2"), "1-2")
+            with self.assertRaises(ValueError):
+                _normalize_number_filter("bad")
+        self.assertIsInstance(_normalize_number_edit(2.0), float)
+        self.assertIs(_normalize_number_edit(2), 2)
+
+    def test_normalize_date_repeated_strings_hit_cache(self):
+        value = "2031-05-06T07:08:09Z"
+        before = _date_filter_str.cache_info().hits
+        for _ in range(3):
+            self.assertEqual(_normalize_date_filter(value), "2031-05-06")
+        self.assertEqual(_date_filter_str.cache_info().hits - before, 2)
 
     def test_normalize_tag_helpers(self):
         self.assertEqual(_normalize_tag_filter("tag1, !tag2"), "tag1, !tag2")
@@ -1403,6 +1237,7 @@ class TracksTypesValidationTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             _normalize_tag_filter("bad,,")
         self.assertEqual(_normalize_tags([1, 2, 0, -1]), [1, 2])
+        self.assertEqual(_normalize_tags([30, 4, 30, 0, 12, 4]), [30, 4, 12])
         self.assertEqual(_normalize_tags([]), [])
         with self.assertRaises(ValueError):
             _normalize_tags("nope")  # type: ignore[arg-type]
@@ -1413,38 +1248,27 @@ class TracksTypesValidationTests(unittest.TestCase):
         self.assertEqual(_normalize_cuepoint_type("2"), "2")
         with self.assertRaises(ValueError):
             _normalize_cuepoint_type(9)  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            _normalize_cuepoint_type("jump")  # type: ignore[arg-type]
+
+    # (cuepoints input, errors attribute that must be set); nothing is kept
+    CUEPOINTS_REJECTED = [
+        ("nope", "fatal"),
+        ([123], "dropped"),
+        ([{"position": 1, "startTime": 0.5}], "dropped"),
+        ([{"position": "1", "startTime": 0.5, "type": "1"}], "dropped"),
+        ([{"position": 1, "startTime": "0.5", "type": "1"}], "dropped"),
+        ([{"position": 1, "startTime": 0.5, "type": "9"}], "dropped"),
+    ]
+
+    def test_normalize_cuepoints_rejected(self):
+        for value, flag in self.CUEPOINTS_REJECTED:
+            with self.subTest(value=value):
+                payload, errors = _normalize_cuepoints(value)
+                self.assertEqual(payload, [])
+                self.assertTrue(getattr(errors, flag))
 
     def test_normalize_cuepoints_paths(self):
-        payload, errors = _normalize_cuepoints("nope")
-        self.assertEqual(payload, [])
-        self.assertTrue(errors.fatal)
-
-        payload, errors = _normalize_cuepoints([123])
-        self.assertEqual(payload, [])
-        self.assertTrue(errors.dropped)
-
-        payload, errors = _normalize_cuepoints([{"position": 1, "startTime": 0.5}])
-        self.assertEqual(payload, [])
-        self.assertTrue(errors.dropped)
-
-        payload, errors = _normalize_cuepoints(
-            [{"position": "1", "startTime": 0.5, "type": "1"}]
-        )
-        self.assertEqual(payload, [])
-        self.assertTrue(errors.dropped)
-
-        payload, errors = _normalize_cuepoints(
-            [{"position": 1, "startTime": "0.5", "type": "1"}]
-        )
-        self.assertEqual(payload, [])
-        self.assertTrue(errors.dropped)
-
-        payload, errors = _normalize_cuepoints(
-            [{"position": 1, "startTime": 0.5, "type": "9"}]
-        )
-        self.assertEqual(payload, [])
-        self.assertTrue(errors.dropped)
-
         payload, errors = _normalize_cuepoints(
             [
                 {
@@ -1519,29 +1343,44 @@ class TracksTypesValidationTests(unittest.TestCase):
         self.assertEqual(payload[0].get("name"), "OnlyName")
         self.assertFalse(errors.fatal or errors.dropped or errors.partial)
 
-    def test_normalize_tempomarkers_paths(self):
-        payload, errors = _normalize_tempomarkers("nope")
-        self.assertEqual(payload, [])
-        self.assertTrue(errors.fatal)
-
-        payload, errors = _normalize_tempomarkers([123])
-        self.assertEqual(payload, [])
-        self.assertTrue(errors.dropped)
-
-        payload, errors = _normalize_tempomarkers([{"startTime": 0.5}])
-        self.assertEqual(payload, [])
-        self.assertTrue(errors.dropped)
-
-        payload, errors = _normalize_tempomarkers([{"startTime": "0.5", "bpm": 120}])
-        self.assertEqual(payload, [])
-        self.assertTrue(errors.dropped)
-
+    # (tempomarkers input, markers kept, errors attribute that must be set)
+    TEMPOMARKERS_REJECTED = [
+        ("nope", 0, "fatal"),
+        ([123], 0, "dropped"),
+        ([{"startTime": 0.5}], 0, "dropped"),
+        ([{"startTime": "0.5", "bpm": 120}], 0, "dropped"),
+        (
+            [{"startTime": 0.5, "bpm": 120}, {"startTime": 0.5, "bpm": 121}],
+            1,
+            "dropped",
+        ),
+        ([{"startTime": 0.5, "bpm": "bad"}], 0, "dropped"),
+    ]
+
+    def test_normalize_tempomarkers_rejected(self):
+        for value, kept, flag in self.TEMPOMARKERS_REJECTED:
+            with self.subTest(value=value):
+                payload, errors = _normalize_tempomarkers(value)
+                self.assertEqual(len(payload), kept)
+                self.assertTrue(getattr(errors, flag))
+
+    def test_normalize_tempomarkers_exact_types(self):
         payload, errors = _normalize_tempomarkers(
-            [{"startTime": 0.5, "bpm": 120}, {"startTime": 0.5, "bpm": 121}]
+            [{"startTime": 0, "bpm": 120}, {"startTime": 1.0, "bpm": True}]
         )
-        self.assertEqual(len(payload), 1)
-        self.assertTrue(errors.dropped)
+        self.assertEqual(payload, [{"startTime": 0.0, "bpm": 120}])
+        self.assertIsInstance(payload[0]["startTime"], float)
+        self.assertEqual(len(errors.dropped), 1)
 
-        payload, errors = _normalize_tempomarkers([{"startTime": 0.5, "bpm": "bad"}])
-        self.assertEqual(payload, [])
-        self.assertTrue(errors.dropped)
+    def test_normalize_cuepoints_exact_types(self):
+        payload, errors = _normalize_cuepoints(
+            [
+                {"position": 1, "startTime": 2, "type": "1", "endTime": 3},
+                {"position": True, "startTime": 1.0, "type": "1"},
+            ]
+        )
+        self.assertEqual(len(payload), 1)
+        self.assertEqual(payload[0]["startTime"], 2.0)
+        self.assertIsInstance(payload[0]["startTime"], float)
+        self.assertIsInstance(payload[0].get("endTime"), float)
+        self.assertEqual(len(errors.dropped), 1)